@@ -0,0 +1,81 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# File: archive_insert.py
+# Created: 19-10-2026
+# Author: Lorenzo Calandra Buonaura <lorenzocb01@gmail.com>
+# Institution: APS Model European Parliament Italia
+#
+# Description: Bulk insert throughput of the SQLite archive and timing of
+#              the cross-session aggregate queries.
+#
+# Usage: python -m benchmarks.archive_insert --sessions 20 --speeches 20000
+#
+
+
+########################
+# IMPORT ZONE          #
+########################
+
+import argparse
+import os
+import random
+import tempfile
+import time
+
+from benchmarks.scoreboard_load import populate
+from mepgest.archive import Archive
+from mepgest.models import delegates
+from mepgest.speech import SpeechType
+
+
+########################
+# FUNCTIONS            #
+########################
+
+def timed(label, function, *args):
+    started = time.perf_counter()
+    result = function(*args)
+    elapsed = time.perf_counter() - started
+    print(f" - {label}: {elapsed * 1e3:.1f} ms")
+    return result, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the SQLite session archive.")
+    parser.add_argument("--sessions", type=int, default=20)
+    parser.add_argument("--delegates", type=int, default=1000)
+    parser.add_argument("--speeches", type=int, default=20_000, help="Speeches per session")
+    parser.add_argument("--db", help="Archive file (default: a temporary file)")
+    args = parser.parse_args()
+
+    populate(args.delegates, n_committees=15, n_schools=80)
+    rng = random.Random(2)
+    pool, types = list(delegates.values()), list(SpeechType)
+    for _ in range(args.speeches):
+        rng.choice(pool).speak(rng.choice(types))
+
+    path = args.db or os.path.join(tempfile.mkdtemp(), "archive.sqlite")
+    rows = args.delegates + args.speeches
+    print(f"💾 Archiving {args.sessions} sessions of {args.delegates} delegates / {args.speeches} speeches")
+    with Archive(path) as archive:
+        total = 0
+        for i in range(args.sessions):
+            started = time.perf_counter()
+            archive.add_session(f"Session {i + 1}")
+            total += time.perf_counter() - started
+        print(f" - insert: {total / args.sessions * 1e3:.1f} ms per session, "
+              f"{rows * args.sessions / total:,.0f} rows/s")
+
+        print("\n🔎 Queries over the whole archive")
+        timed("participation per school", archive.participation, "school")
+        timed("participation per committee", archive.participation, "committee")
+        timed("under-speaking schools", archive.under_speaking)
+        timed("speech types of one school", archive.speech_types, "School 1")
+        timed("delegate history", archive.delegate_history, "Name1", "Surname1")
+
+    print(f"\n✅ Archive at {path} ({os.path.getsize(path) / 1e6:.1f} MB)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# File: gui_construction.py
+# Created: 19-10-2026
+# Author: Lorenzo Calandra Buonaura <lorenzocb01@gmail.com>
+# Institution: APS Model European Parliament Italia
+#
+# Description: Time to toggle the theme and to build (and refresh) the
+#              General and Committees tabs over a synthetic roster, with
+#              the application stylesheet applied as in the GUI.
+#
+# Usage: QT_QPA_PLATFORM=offscreen python -m benchmarks.gui_construction --delegates 600
+#
+
+
+########################
+# IMPORT ZONE          #
+########################
+
+import argparse
+import statistics
+import time
+
+from PySide6.QtCore import QEvent
+from PySide6.QtWidgets import QApplication, QTabWidget
+
+from benchmarks.scoreboard_load import populate
+
+
+########################
+# FUNCTIONS            #
+########################
+
+def flush():
+    """Run what the event loop would: pending polish/layout and deleteLater()s,
+    which processEvents() alone leaves queued outside app.exec()."""
+    QApplication.processEvents()
+    QApplication.sendPostedEvents(None, QEvent.DeferredDelete)
+
+
+def timed(function, repeat):
+    """Median wall time of `function()` over `repeat` runs, in milliseconds."""
+    runs = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        flush()
+        runs.append((time.perf_counter() - start) * 1e3)
+    return statistics.median(runs)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark theme toggling and tab construction.")
+    parser.add_argument("--delegates", type=int, default=600)
+    parser.add_argument("--committees", type=int, default=12)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    app = QApplication.instance() or QApplication([])
+    from mepgest import gui
+    from mepgest.style import apply_theme
+    apply_theme(app)  # As in launch_gui()
+
+    populate(args.delegates, n_committees=args.committees)
+    manager = gui.DelegateManager()
+    menu = gui.SettingsMenu(app, manager)
+    tabs = QTabWidget()
+
+    results = {
+        "General tab (build)": timed(lambda: gui.GeneralTab(tabs, manager).deleteLater(), args.repeat),
+        "Committees tab (build)": timed(lambda: gui.CommitteesTab(tabs, manager).widget().deleteLater(), args.repeat),
+    }
+
+    # Refresh and theme toggle on live, visible tabs
+    general = gui.GeneralTab(tabs, manager)
+    committees_tab = gui.CommitteesTab(tabs, manager)
+    tabs.addTab(general, "General List")
+    tabs.addTab(committees_tab.widget(), "Committees")
+    tabs.show()
+    flush()
+    results["General tab (refresh)"] = timed(general.refresh_tab, args.repeat)
+    results["Committees tab (refresh)"] = timed(committees_tab.refresh_tab, args.repeat)
+    results["Theme toggle"] = timed(menu.toggle_theme, args.repeat * 2)
+
+    print(f"\n⏱️ {args.delegates} delegates, {args.committees} committees (median of runs)\n")
+    for name, ms in results.items():
+        print(f"{name:<28}{ms:>10.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# File: scoreboard_load.py
+# Created: 19-10-2026
+# Author: Lorenzo Calandra Buonaura <lorenzocb01@gmail.com>
+# Institution: APS Model European Parliament Italia
+#
+# Description: Load generator for the HTTP scoreboard. Without --url it
+#              starts a local server over a synthetic session and keeps
+#              adding speeches while the clients poll.
+#
+# Usage: python -m benchmarks.scoreboard_load --clients 300 --seconds 10
+#
+
+
+########################
+# IMPORT ZONE          #
+########################
+
+import argparse
+import asyncio
+import random
+import threading
+import time
+from urllib.parse import urlsplit
+
+from mepgest.models import Delegate, delegates, assign_delegate_codes
+from mepgest.scoreboard import ScoreboardServer
+from mepgest.speech import SpeechType
+
+
+########################
+# FUNCTIONS            #
+########################
+
+def populate(n_delegates, n_committees=12, n_schools=40, seed=0):
+    rng = random.Random(seed)
+    for i in range(n_delegates):
+        Delegate(
+            name=f"Name{i}",
+            surname=f"Surname{i}",
+            gender=rng.choice("MF"),
+            committee_name=str(1 + i % n_committees),
+            school_name=f"School {rng.randrange(n_schools)}",
+        )
+    assign_delegate_codes()
+
+
+def mutate(stop, interval, seed=0):
+    """Add a random speech every `interval` seconds until `stop` is set."""
+    rng = random.Random(seed)
+    codes = list(delegates)
+    types = list(SpeechType)
+    while not stop.wait(interval):
+        delegates[rng.choice(codes)].speak(rng.choice(types))
+
+
+async def poll_client(host, port, path, deadline, stats):
+    """Keep-alive client re-fetching `path` with If-None-Match."""
+    reader, writer = await asyncio.open_connection(host, port)
+    etag = None
+    try:
+        while time.perf_counter() < deadline:
+            request = f"GET {path} HTTP/1.1\r\nHost: {host}\r\n"
+            if etag:
+                request += f"If-None-Match: {etag}\r\n"
+            writer.write((request + "\r\n").encode("latin-1"))
+
+            started = time.perf_counter()
+            status = int((await reader.readline()).split()[1])
+            length = 0
+            while True:
+                line = await reader.readline()
+                if line in (b"\r\n", b""):
+                    break
+                name, _, value = line.decode("latin-1").partition(":")
+                if name.lower() == "content-length":
+                    length = int(value)
+                elif name.lower() == "etag":
+                    etag = value.strip()
+            await reader.readexactly(length)
+
+            stats["latency"].append(time.perf_counter() - started)
+            stats[status] = stats.get(status, 0) + 1
+            stats["bytes"] += length
+            await asyncio.sleep(stats["think"])
+    finally:
+        writer.close()
+
+
+async def run_clients(url, clients, seconds, think):
+    parts = urlsplit(url)
+    deadline = time.perf_counter() + seconds
+    stats = {"latency": [], "bytes": 0, "think": think}
+    await asyncio.gather(*(
+        poll_client(parts.hostname, parts.port, "/api/rankings", deadline, stats)
+        for _ in range(clients)
+    ))
+    return stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Hammer the scoreboard with polling clients.")
+    parser.add_argument("--url", help="Existing scoreboard (default: start a local one)")
+    parser.add_argument("--clients", type=int, default=300)
+    parser.add_argument("--seconds", type=float, default=10.0)
+    parser.add_argument("--think", type=float, default=0.05, help="Pause between requests of a client")
+    parser.add_argument("--delegates", type=int, default=600)
+    parser.add_argument("--speech-interval", type=float, default=0.5)
+    args = parser.parse_args()
+
+    server = None
+    stop = threading.Event()
+    url = args.url
+    if url is None:
+        populate(args.delegates)
+        server = ScoreboardServer(port=0)
+        server.start()
+        url = server.url
+        threading.Thread(target=mutate, args=(stop, args.speech_interval), daemon=True).start()
+
+    print(f"🚀 {args.clients} clients against {url} for {args.seconds:.0f}s...")
+    stats = asyncio.run(run_clients(url, args.clients, args.seconds, args.think))
+
+    stop.set()
+    if server is not None:
+        server.stop()
+
+    latency = sorted(stats["latency"])
+    total = len(latency)
+    print(f"\n✅ {total} requests ({total / args.seconds:.0f} req/s)")
+    print(f" - 200: {stats.get(200, 0)}   304: {stats.get(304, 0)}")
+    print(f" - {stats['bytes'] / 1e6:.1f} MB of bodies")
+    if total:
+        print(f" - latency p50 {latency[total // 2] * 1e3:.1f} ms, "
+              f"p99 {latency[int(total * 0.99)] * 1e3:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# File: scoring_policies.py
+# Created: 19-10-2026
+# Author: Lorenzo Calandra Buonaura <lorenzocb01@gmail.com>
+# Institution: APS Model European Parliament Italia
+#
+# Description: Time to switch a large synthetic session to each scoring
+#              policy and re-rank it, as the settings menu does
+#              (target: < 50 ms for 10k delegates), and to score a delegate
+#              after recording or undoing one speech.
+#
+# Usage: python -m benchmarks.scoring_policies --delegates 10000 --speeches 50000
+#
+
+
+########################
+# IMPORT ZONE          #
+########################
+
+import argparse
+import random
+import time
+
+from benchmarks.scoreboard_load import populate
+from mepgest.models import delegates
+from mepgest import scoring
+from mepgest.scoring import POLICIES, session_arrays, set_policy, ranking, score_of
+from mepgest.speech import SpeechType
+
+
+########################
+# FUNCTIONS            #
+########################
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark scoring policies.")
+    parser.add_argument("--delegates", type=int, default=10_000)
+    parser.add_argument("--speeches", type=int, default=50_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    populate(args.delegates, n_committees=20, n_schools=300)
+    rng = random.Random(1)
+    pool, types = list(delegates.values()), list(SpeechType)
+    for _ in range(args.speeches):
+        rng.choice(pool).speak(rng.choice(types))
+
+    started = time.perf_counter()
+    session_arrays()
+    print(f"📊 Arrays for {args.delegates} delegates / {args.speeches} speeches: "
+          f"{(time.perf_counter() - started) * 1e3:.1f} ms (first build; speeches then update it in place)")
+
+    # Policy swap + full ranking; scores are dropped before each run so every
+    # repeat pays for the evaluation, as the first switch to a policy does
+    for name in POLICIES:
+        best = float("inf")
+        for _ in range(args.repeat):
+            scoring._cache["scores"].clear()
+            started = time.perf_counter()
+            set_policy(name)
+            ranking()
+            best = min(best, time.perf_counter() - started)
+        print(f" - {name}: {best * 1e3:.1f} ms")
+
+    # One speech recorded then undone, each followed by a score read as the GUI does
+    print("\n🎤 Speech + undo, scored after each:")
+    for name in POLICIES:
+        set_policy(name)
+        best = float("inf")
+        for _ in range(args.repeat):
+            delegate = rng.choice(pool)
+            started = time.perf_counter()
+            speech = delegate.speak(rng.choice(types))
+            score_of(delegate)
+            delegate.remove_speech(speech)
+            score_of(delegate)
+            best = min(best, (time.perf_counter() - started) / 2)
+        print(f" - {name}: {best * 1e3:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,3 +1,7 @@
+from multiprocessing import freeze_support
+
 from mepgest.gui import launch_gui
 
-launch_gui()
\ No newline at end of file
+if __name__ == "__main__":
+    freeze_support()  # Roster imports use a process pool, also in the frozen app
+    launch_gui()
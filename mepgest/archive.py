@@ -0,0 +1,230 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# File: archive.py
+# Created: 19-10-2026
+# Author: Lorenzo Calandra Buonaura <lorenzocb01@gmail.com>
+# Institution: APS Model European Parliament Italia
+#
+# Description: Optional SQLite archive of past sessions (stdlib sqlite3,
+#              fully offline). A live session is written in one bulk
+#              transaction; indexed aggregate queries answer season-level
+#              questions across every archived event.
+#
+
+
+########################
+# IMPORT ZONE          #
+########################
+
+import sqlite3
+from datetime import datetime
+from time import time as wall_clock
+
+from mepgest.models import speech_log
+from mepgest.scoring import get_policy, ranking
+from mepgest.timeline import wall_time
+
+
+########################
+# CLASSES              #
+########################
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS sessions (
+    id          INTEGER PRIMARY KEY,
+    name        TEXT NOT NULL,
+    archived_at REAL NOT NULL,
+    policy      TEXT
+);
+CREATE TABLE IF NOT EXISTS delegates (
+    id          INTEGER PRIMARY KEY,
+    session_id  INTEGER NOT NULL REFERENCES sessions(id) ON DELETE CASCADE,
+    code        TEXT,
+    name        TEXT,
+    surname     TEXT,
+    gender      TEXT,
+    committee   TEXT,
+    school      TEXT,
+    speeches    INTEGER NOT NULL,  -- Denormalised: aggregates need no join
+    weight      REAL,
+    score       REAL
+);
+CREATE TABLE IF NOT EXISTS speeches (
+    id          INTEGER PRIMARY KEY,
+    session_id  INTEGER NOT NULL REFERENCES sessions(id) ON DELETE CASCADE,
+    delegate_id INTEGER NOT NULL REFERENCES delegates(id) ON DELETE CASCADE,
+    type        TEXT NOT NULL,
+    weight      REAL NOT NULL,
+    time        REAL NOT NULL,
+    duration    REAL
+);
+CREATE INDEX IF NOT EXISTS delegates_session ON delegates(session_id, code);
+CREATE INDEX IF NOT EXISTS delegates_school ON delegates(school, session_id, speeches, weight);
+CREATE INDEX IF NOT EXISTS delegates_committee ON delegates(committee, session_id, speeches, weight);
+CREATE INDEX IF NOT EXISTS delegates_person ON delegates(surname, name, school);
+CREATE INDEX IF NOT EXISTS speeches_delegate ON speeches(delegate_id, type, weight);
+CREATE INDEX IF NOT EXISTS speeches_type ON speeches(type, session_id);
+CREATE INDEX IF NOT EXISTS speeches_session ON speeches(session_id, time);
+"""
+
+
+class Archive:
+    """SQLite archive of sessions. Use as a context manager or call close()."""
+
+    def __init__(self, path):
+        self.path = path
+        self.conn = sqlite3.connect(path)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA foreign_keys = ON")
+        self.conn.execute("PRAGMA journal_mode = WAL")
+        self.conn.execute("PRAGMA synchronous = NORMAL")
+        self.conn.executescript(SCHEMA)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        self.conn.close()
+
+    # --- Writing ---
+
+    def add_session(self, name):
+        """Write the live session (delegates with their current scores and
+        every speech) in a single transaction. Returns the session id."""
+        with self.conn:
+            self.conn.execute("BEGIN IMMEDIATE")  # Ids below are allocated by us
+            session_id = self.conn.execute(
+                "INSERT INTO sessions (name, archived_at, policy) VALUES (?, ?, ?)",
+                (name, wall_clock(), get_policy().name),
+            ).lastrowid
+
+            next_id = self.conn.execute("SELECT COALESCE(MAX(id), 0) + 1 FROM delegates").fetchone()[0]
+            delegate_ids = {}
+            rows = []
+            for delegate, score in ranking():
+                delegate_ids[delegate._serial] = next_id
+                rows.append((
+                    next_id, session_id, delegate.code, delegate.name, delegate.surname, delegate.gender,
+                    delegate.committee_name, delegate.school_name, delegate.speech_count(),
+                    delegate.total_weight(), score,
+                ))
+                next_id += 1
+            self.conn.executemany("INSERT INTO delegates VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", rows)
+
+            self.conn.executemany(
+                "INSERT INTO speeches (session_id, delegate_id, type, weight, time, duration) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    (session_id, delegate_ids[speech["delegate"]._serial], speech["type"].value,
+                     speech["weight"], wall_time(speech["time"]), speech["duration"])
+                    for speech in speech_log
+                ),
+            )
+        return session_id
+
+    def delete_session(self, session_id):
+        with self.conn:
+            self.conn.execute("DELETE FROM sessions WHERE id = ?", (session_id,))
+
+    # --- Queries ---
+
+    def sessions(self):
+        return [dict(row) for row in self.conn.execute(
+            "SELECT s.id, s.name, s.archived_at, s.policy, "
+            "(SELECT COUNT(*) FROM delegates d WHERE d.session_id = s.id) AS delegates, "
+            "(SELECT COUNT(*) FROM speeches p WHERE p.session_id = s.id) AS speeches "
+            "FROM sessions s ORDER BY s.id"
+        )]
+
+    def participation(self, group="school"):
+        """Speaking totals per school (or committee) across all sessions.
+
+        Each row has the number of sessions and delegates, speeches and
+        weight, and `ratio`: speeches per delegate relative to the
+        season-wide average (below 1 means the group under-speaks).
+        """
+        if group not in ("school", "committee"):
+            raise ValueError("group must be 'school' or 'committee'")
+
+        # Served from the covering (group, session_id, speeches, weight) index
+        rows = self.conn.execute(f"""
+            SELECT {group} AS name,
+                   COUNT(DISTINCT session_id) AS sessions,
+                   COUNT(*) AS delegates,
+                   SUM(speeches) AS speeches,
+                   SUM(weight) AS weight
+            FROM delegates
+            GROUP BY {group}
+            ORDER BY {group}
+        """).fetchall()
+
+        total_delegates = sum(row["delegates"] for row in rows)
+        total_speeches = sum(row["speeches"] for row in rows)
+        average = total_speeches / total_delegates if total_delegates else 0
+        result = []
+        for row in rows:
+            row = dict(row)
+            per_delegate = row["speeches"] / row["delegates"]
+            row["speeches_per_delegate"] = per_delegate
+            row["ratio"] = per_delegate / average if average else 0
+            result.append(row)
+        return result
+
+    def under_speaking(self, group="school", threshold=0.75, min_sessions=1):
+        """Schools (or committees) whose speeches per delegate stay below
+        `threshold` times the season average, lowest first."""
+        rows = [
+            row for row in self.participation(group)
+            if row["ratio"] < threshold and row["sessions"] >= min_sessions
+        ]
+        return sorted(rows, key=lambda row: row["ratio"])
+
+    def speech_types(self, school=None, committee=None):
+        """Number of speeches per type, optionally for one school or committee."""
+        query = "SELECT s.type, COUNT(*) AS speeches FROM speeches s"
+        params = []
+        if school is not None or committee is not None:
+            query += " JOIN delegates d ON d.id = s.delegate_id WHERE "
+            conditions = []
+            if school is not None:
+                conditions.append("d.school = ?")
+                params.append(school)
+            if committee is not None:
+                conditions.append("d.committee = ?")
+                params.append(committee)
+            query += " AND ".join(conditions)
+        query += " GROUP BY s.type ORDER BY speeches DESC"
+        return {row["type"]: row["speeches"] for row in self.conn.execute(query, params)}
+
+    def delegate_history(self, name, surname, school=None):
+        """Sessions of one person with their speeches and score."""
+        query = """
+            SELECT se.name AS session, d.code, d.committee, d.school, d.speeches, d.weight, d.score
+            FROM delegates d JOIN sessions se ON se.id = d.session_id
+            WHERE d.surname = ? AND d.name = ?
+        """
+        params = [surname, name]
+        if school is not None:
+            query += " AND d.school = ?"
+            params.append(school)
+        return [dict(row) for row in self.conn.execute(query + " ORDER BY se.id", params)]
+
+    def speech_rows(self, session_id=None):
+        """Yield archived speeches in the layout of mepgest.export.SPEECH_HEADER,
+        streamed from the database (e.g. for a season export)."""
+        query = """
+            SELECT s.id, s.time, s.duration, d.code, d.surname, d.name, d.committee, d.school, s.type, s.weight
+            FROM speeches s JOIN delegates d ON d.id = s.delegate_id
+        """
+        params = ()
+        if session_id is not None:
+            query += " WHERE s.session_id = ?"
+            params = (session_id,)
+        cursor = self.conn.cursor()
+        cursor.row_factory = None
+        for row in cursor.execute(query + " ORDER BY s.id", params):
+            yield (row[0], datetime.fromtimestamp(row[1])) + row[2:]
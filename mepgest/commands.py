@@ -0,0 +1,252 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# File: commands.py
+# Created: 19-10-2026
+# Author: Lorenzo Calandra Buonaura <lorenzocb01@gmail.com>
+# Institution: APS Model European Parliament Italia
+#
+# Description: Undoable session mutations. Every change to the speeches is
+#              a command holding the exact speech records it touched, so
+#              its inverse is a plain detach/attach on the incremental
+#              totals instead of a rescan of the session.
+#
+
+
+########################
+# IMPORT ZONE          #
+########################
+
+import re
+from collections import deque
+
+from mepgest.models import batch, delegates
+from mepgest.speech import SpeechType
+
+
+########################
+# CLASSES              #
+########################
+
+class Command:
+    """A reversible change. `speech_ids` lists the speeches it touches."""
+
+    label = ""
+
+    def do(self):
+        raise NotImplementedError
+
+    def undo(self):
+        raise NotImplementedError
+
+    @property
+    def speech_ids(self):
+        raise NotImplementedError
+
+
+class Speak(Command):
+    label = "Add speech"
+
+    def __init__(self, delegate, speech_type):
+        self.delegate = delegate
+        self.speech_type = speech_type
+        self.speech = None
+
+    def do(self):
+        if self.speech is None:
+            self.speech = self.delegate.speak(self.speech_type)
+        else:
+            self.delegate.add_speech(self.speech)  # Redo keeps the original record
+
+    def undo(self):
+        self.delegate.remove_speech(self.speech)
+
+    @property
+    def speech_ids(self):
+        return [self.speech["id"]]
+
+
+class Unspeak(Command):
+    label = "Delete speech"
+
+    def __init__(self, speech):
+        self.speech = speech
+        self.delegate = speech["delegate"]
+
+    def do(self):
+        self.delegate.remove_speech(self.speech)
+
+    def undo(self):
+        self.delegate.add_speech(self.speech)
+
+    @property
+    def speech_ids(self):
+        return [self.speech["id"]]
+
+
+class EditSpeech(Command):
+    """Change the type of a speech and/or reassign it to another delegate.
+
+    The edited speech keeps its id, so it stays in place in the history.
+    """
+
+    label = "Edit speech"
+
+    def __init__(self, speech, new_delegate, new_type):
+        self.old_speech = speech
+        self.old_delegate = speech["delegate"]
+        self.new_delegate = new_delegate
+        self.new_speech = dict(speech, type=new_type, weight=SpeechType.get_weight(new_type))
+
+    def do(self):
+        self.old_delegate.remove_speech(self.old_speech)
+        self.new_delegate.add_speech(self.new_speech)
+
+    def undo(self):
+        self.new_delegate.remove_speech(self.new_speech)
+        self.old_delegate.add_speech(self.old_speech)
+
+    @property
+    def speech_ids(self):
+        return [self.old_speech["id"]]
+
+
+class Batch(Command):
+    """Several commands applied, undone and redone as one.
+
+    The session publishes a single revision for the whole batch, so the
+    scores and the views are refreshed once.
+    """
+
+    def __init__(self, commands, label=None):
+        self.commands = list(commands)
+        self.label = label or f"{len(self.commands)} changes"
+
+    def do(self):
+        with batch():
+            for command in self.commands:
+                command.do()
+
+    def undo(self):
+        with batch():
+            for command in reversed(self.commands):
+                command.undo()
+
+    @property
+    def speech_ids(self):
+        return [speech_id for command in self.commands for speech_id in command.speech_ids]
+
+
+class CommandLog:
+    """Undo/redo history kept in a bounded ring buffer."""
+
+    def __init__(self, limit=500):
+        self._undo = deque(maxlen=limit)
+        self._redo = deque(maxlen=limit)
+
+    def execute(self, command):
+        command.do()
+        self._undo.append(command)
+        self._redo.clear()
+        return command
+
+    def undo(self):
+        """Revert the last command and return it (None if nothing to undo)."""
+        if not self._undo:
+            return None
+        command = self._undo.pop()
+        command.undo()
+        self._redo.append(command)
+        return command
+
+    def redo(self):
+        """Re-apply the last undone command and return it (None if nothing to redo)."""
+        if not self._redo:
+            return None
+        command = self._redo.pop()
+        command.do()
+        self._undo.append(command)
+        return command
+
+    def can_undo(self):
+        return bool(self._undo)
+
+    def can_redo(self):
+        return bool(self._redo)
+
+    def clear(self):
+        self._undo.clear()
+        self._redo.clear()
+
+
+########################
+# FUNCTIONS            #
+########################
+
+# Short forms accepted by the batch entry, besides the full labels
+SPEECH_ALIASES = {
+    "op": SpeechType.OPENING,
+    "as": SpeechType.AMENDMENT_SPEECH,
+    "ad": SpeechType.AMENDMENT_DEFENSE,
+    "fu": SpeechType.FOLLOW_UP,
+    "fd": SpeechType.FOLLOW_UP_DEFENSE,
+    "in": SpeechType.INTERVENTION,
+    "de": SpeechType.DEFENSE,
+    "sa": SpeechType.SPEECH_AGAINST,
+    "cl": SpeechType.CLOSING,
+}
+
+_LABELS = {speech_type.value.casefold(): speech_type for speech_type in SpeechType}
+
+
+def parse_speech_type(text):
+    """SpeechType from a full label, an alias or an unambiguous label prefix
+    (case-insensitive). Raises ValueError otherwise."""
+    key = text.strip().casefold()
+    if key in _LABELS:
+        return _LABELS[key]
+    if key in SPEECH_ALIASES:
+        return SPEECH_ALIASES[key]
+    matches = [speech_type for label, speech_type in _LABELS.items() if key and label.startswith(key)]
+    if len(matches) == 1:
+        return matches[0]
+    if matches:
+        raise ValueError(f"ambiguous speech type '{text.strip()}'")
+    raise ValueError(f"unknown speech type '{text.strip()}'")
+
+
+def parse_speech_lines(text, default_type=None):
+    """Validate a batch of speeches, one "<code> [type]" entry per line.
+
+    Code and type may be separated by spaces, a comma or a tab (cells pasted
+    from a spreadsheet); entries may also be separated by ";". A missing
+    type means `default_type`. Returns (staged, errors): staged is a list
+    of (delegate, SpeechType) in entry order, errors a list of
+    (line number, entry, message). Nothing is recorded.
+    """
+    staged, errors = [], []
+    for number, line in enumerate(text.splitlines(), 1):
+        for entry in line.split(";"):
+            entry = entry.strip()
+            if not entry:
+                continue
+            parts = re.split(r"[\s,]+", entry, maxsplit=1)
+            code = parts[0].upper()
+            delegate = delegates.get(code)
+            if delegate is None:
+                errors.append((number, entry, f"no delegate with code {code}"))
+                continue
+
+            if len(parts) == 1:
+                if default_type is None:
+                    errors.append((number, entry, "missing speech type"))
+                    continue
+                speech_type = default_type
+            else:
+                try:
+                    speech_type = parse_speech_type(parts[1])
+                except ValueError as e:
+                    errors.append((number, entry, str(e)))
+                    continue
+            staged.append((delegate, speech_type))
+    return staged, errors
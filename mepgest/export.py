@@ -0,0 +1,187 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# File: export.py
+# Created: 19-10-2026
+# Author: Lorenzo Calandra Buonaura <lorenzocb01@gmail.com>
+# Institution: APS Model European Parliament Italia
+#
+# Description: Export of rankings, committee/school aggregates and the
+#              speech log to XLSX, CSV or Parquet. Tables are built as
+#              columns in one pass and written through streaming writers,
+#              so the speech log never has to fit in memory at once.
+#
+
+
+########################
+# IMPORT ZONE          #
+########################
+
+import csv
+import os
+from datetime import datetime
+from itertools import islice
+
+from mepgest.models import committees, schools, speech_log
+from mepgest.scoring import ranking
+from mepgest.timeline import wall_time
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # Parquet export is optional
+    pa = None
+
+
+########################
+# FUNCTIONS            #
+########################
+
+RANKING_HEADER = ["Rank", "Code", "Surname", "Name", "Gender", "Committee", "School", "Speeches", "Weight", "Score"]
+GROUP_HEADER = ["Name", "Delegates", "Speeches", "Total weight", "Mean weight", "Median weight", "Top speaker"]
+SPEECH_HEADER = ["Id", "Time", "Duration", "Code", "Surname", "Name", "Committee", "School", "Type", "Weight"]
+
+SPEECH_TYPES = ["int64", None, "float64", "string", "string", "string", "string", "string", "string", "float64"]
+
+BATCH_SIZE = 65536  # Rows per Parquet row group
+
+
+def ranking_columns():
+    """Delegate rankings as columns (highest score first), in one pass."""
+    columns = {name: [] for name in RANKING_HEADER}
+    for rank, (delegate, score) in enumerate(ranking(), start=1):
+        columns["Rank"].append(rank)
+        columns["Code"].append(delegate.code)
+        columns["Surname"].append(delegate.surname)
+        columns["Name"].append(delegate.name)
+        columns["Gender"].append(delegate.gender)
+        columns["Committee"].append(delegate.committee_name)
+        columns["School"].append(delegate.school_name)
+        columns["Speeches"].append(delegate.speech_count())
+        columns["Weight"].append(delegate.total_weight())
+        columns["Score"].append(round(score, 4))
+    return columns
+
+
+def group_columns(groups):
+    """Aggregates of committees or schools as columns, from their cached statistics."""
+    columns = {name: [] for name in GROUP_HEADER}
+    for name, group in sorted(groups.items()):
+        stats = group.statistics()
+        columns["Name"].append(name)
+        columns["Delegates"].append(stats["delegates"])
+        columns["Speeches"].append(stats["speeches"])
+        columns["Total weight"].append(stats["total_weight"])
+        columns["Mean weight"].append(round(stats["mean_weight"], 4))
+        columns["Median weight"].append(stats["median_weight"])
+        columns["Top speaker"].append(stats["top_speaker"])
+    return columns
+
+
+def speech_rows(speeches=None):
+    """Yield one row per speech of the log (or of any iterable of speech records)."""
+    for speech in speech_log if speeches is None else speeches:
+        delegate = speech["delegate"]
+        yield (
+            speech["id"],
+            datetime.fromtimestamp(wall_time(speech["time"])),
+            speech["duration"],
+            delegate.code,
+            delegate.surname,
+            delegate.name,
+            delegate.committee_name,
+            delegate.school_name,
+            speech["type"].value,
+            speech["weight"],
+        )
+
+
+def column_rows(columns):
+    return zip(*columns.values())
+
+
+def write_csv(path, header, rows):
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(header)
+        writer.writerows(rows)
+
+
+def write_xlsx(path, sheets):
+    """Write {sheet name: (header, rows)} with openpyxl's write-only mode."""
+    from openpyxl import Workbook
+
+    workbook = Workbook(write_only=True)
+    for title, (header, rows) in sheets.items():
+        sheet = workbook.create_sheet(title)
+        sheet.append(header)
+        for row in rows:
+            sheet.append(row)
+    workbook.save(path)
+
+
+def write_parquet(path, header, rows, types=None, batch_size=BATCH_SIZE):
+    """Write rows in row groups of `batch_size`. `types` are pyarrow type
+    names (e.g. "float64") for columns whose type can't be inferred from the
+    first batch, such as a column that starts with missing values."""
+    if pa is None:
+        raise ImportError("Parquet export needs pyarrow (pip install pyarrow)")
+
+    types = types or [None] * len(header)
+    rows = iter(rows)
+    writer = None
+    try:
+        while True:
+            batch = list(islice(rows, batch_size))
+            if not batch and writer is not None:
+                break
+            columns = list(zip(*batch)) if batch else [[] for _ in header]
+            arrays = [
+                pa.array(column, type=getattr(pa, kind)() if kind else (None if batch else pa.null()))
+                for column, kind in zip(columns, types)
+            ]
+            table = pa.Table.from_arrays(arrays, names=header)
+            if writer is None:
+                writer = pq.ParquetWriter(path, table.schema)
+            writer.write_table(table)
+            if len(batch) < batch_size:
+                break
+    finally:
+        if writer is not None:
+            writer.close()
+
+
+def export_session(path, speeches=None):
+    """Export rankings, committees, schools and speeches.
+
+    The format follows the extension of `path`: `.xlsx` writes one workbook
+    with a sheet per table; `.csv` and `.parquet` write one file per table
+    next to `path` (e.g. results_rankings.csv). `speeches` may replace the
+    live speech log with any iterable of speech records. Returns the
+    written paths.
+    """
+    base, ext = os.path.splitext(path)
+    ext = ext.lower()
+    tables = {
+        "Rankings": (RANKING_HEADER, column_rows(ranking_columns())),
+        "Committees": (GROUP_HEADER, column_rows(group_columns(committees))),
+        "Schools": (GROUP_HEADER, column_rows(group_columns(schools))),
+        "Speeches": (SPEECH_HEADER, speech_rows(speeches)),
+    }
+
+    if ext == ".xlsx":
+        write_xlsx(path, tables)
+        return [path]
+
+    if ext not in (".csv", ".parquet"):
+        raise ValueError(f"Unsupported export format: {ext or path}")
+
+    written = []
+    for title, (header, rows) in tables.items():
+        table_path = f"{base}_{title.lower()}{ext}"
+        if ext == ".csv":
+            write_csv(table_path, header, rows)
+        else:
+            write_parquet(table_path, header, rows, SPEECH_TYPES if title == "Speeches" else None)
+        written.append(table_path)
+    return written
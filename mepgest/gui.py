@@ -1,39 +1,61 @@
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QLabel,
     QTabWidget, QVBoxLayout, QHBoxLayout, QScrollArea, QGridLayout,
-    QListWidget, QLineEdit, QPushButton, QComboBox, QMessageBox
+    QListView, QLineEdit, QPushButton, QComboBox, QMessageBox, QInputDialog,
+    QPlainTextEdit
 )
-from PySide6.QtGui import QFont
-from PySide6.QtCore import Qt, Signal, QObject
+from PySide6.QtCore import Qt, Signal, QObject, QTimer, QAbstractListModel, QModelIndex, QMargins, QEvent
 from PySide6.QtWidgets import QMenu, QToolBar, QFileDialog
-from PySide6.QtGui import QAction
-
-from mepgest.models import committees, schools, delegates
-from mepgest.loaders import load_delegates
+from PySide6.QtGui import QAction, QActionGroup, QKeySequence, QShortcut
+
+from mepgest.models import committees, schools, delegates, find_speech, speech_log
+from mepgest.commands import CommandLog, Speak, Unspeak, EditSpeech, Batch, parse_speech_lines
+from mepgest.loaders import load_delegates, load_rosters
+from mepgest.export import export_session
+from mepgest.archive import Archive
+from mepgest.scoreboard import ScoreboardServer
 from mepgest.speech import SpeechType
+from mepgest.timeline import timeline
+from mepgest.scoring import POLICIES, get_policy, set_policy, score_of
+from mepgest.style import apply_theme, toggle_theme, preload
 
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.figure import Figure
 import matplotlib.pyplot as plt
 
+import glob
 import json
-import qdarktheme
+import os
+import sqlite3
+from bisect import bisect_left, insort
+from time import monotonic
 
 committee_score_labels = {}
 
+# Delegate rows: one grid per list, spaced like the former one-widget-per-row layout
+ROW_MARGINS = QMargins(18, 18, 18, 18)
+ROW_COLUMN_SPACING = 6
+ROW_SPACING = 24
+
+TIMELINE_MINUTES = 60       # Width of the rolling timeline window
+TIMELINE_BUCKET_MINUTES = 5
+
 
 # Delegate Manager to handle score updates
 class DelegateManager(QObject):
     score_updated = Signal()  # Signal to notify other parts of the app when score changes
     delegates_updated = Signal()  # Signal to notify when the delegates list is updated
+    speeches_changed = Signal(list)  # Ids of the speeches added, edited or removed
 
     def __init__(self):
         super().__init__()
         self.delegates = []  # List to hold the loaded Delegate instances
+        self.commands = CommandLog()
 
     def set_delegates(self, delegates):
         """Sets the delegates in the manager and emits the update signal."""
         self.delegates = delegates
+        self.commands.clear()  # Commands refer to the previous roster
         self.delegates_updated.emit()  # Notify other parts of the app that delegates are updated
 
     def get_delegates(self):
@@ -44,6 +66,28 @@ class DelegateManager(QObject):
         """This method emits the signal to notify other parts of the app when the score is updated."""
         self.score_updated.emit()
 
+    def execute(self, command):
+        """Apply an undoable command and notify the views."""
+        self.commands.execute(command)
+        self._command_applied(command)
+        return command
+
+    def undo(self):
+        command = self.commands.undo()
+        if command is not None:
+            self._command_applied(command)
+        return command
+
+    def redo(self):
+        command = self.commands.redo()
+        if command is not None:
+            self._command_applied(command)
+        return command
+
+    def _command_applied(self, command):
+        self.speeches_changed.emit(command.speech_ids)
+        self.update_score()
+
 
 
 class GeneralTab(QWidget):
@@ -62,19 +106,19 @@ class GeneralTab(QWidget):
         header_layout = QHBoxLayout(header_frame)
 
         code_header = QLabel("Code")
-        code_header.setFont(QFont("Arial", 12, QFont.Bold))
+        code_header.setObjectName("columnHeader")
         code_header.setFixedWidth(80)
 
         name_header = QLabel("Name")
-        name_header.setFont(QFont("Arial", 12, QFont.Bold))
+        name_header.setObjectName("columnHeader")
         name_header.setFixedWidth(180)
 
         speech_header = QLabel("Speeches")
-        speech_header.setFont(QFont("Arial", 12, QFont.Bold))
+        speech_header.setObjectName("columnHeader")
         speech_header.setFixedWidth(100)
 
         score_header = QLabel("Score")
-        score_header.setFont(QFont("Arial", 12, QFont.Bold))
+        score_header.setObjectName("columnHeader")
         score_header.setFixedWidth(100)
 
         header_layout.addWidget(code_header)
@@ -88,45 +132,42 @@ class GeneralTab(QWidget):
         # === SCROLL AREA FOR DELEGATES ===
         self.scroll = QScrollArea()
         self.scroll.setWidgetResizable(True)
+        # One grid for all rows: no container widget per row to style, and the
+        # grid is built detached, then attached once (adding rows one by one
+        # to a visible tree would polish and lay out each of them)
         inner_widget = QWidget()
-        inner_layout = QVBoxLayout(inner_widget)
+        inner_layout = QGridLayout(inner_widget)
+        inner_layout.setContentsMargins(ROW_MARGINS)
+        inner_layout.setHorizontalSpacing(ROW_COLUMN_SPACING)
+        inner_layout.setVerticalSpacing(ROW_SPACING)
 
         # Get all delegates sorted by score
         all_delegates = []
         for committee in committees.values():
             all_delegates.extend(committee.delegates)
-        all_delegates.sort(key=lambda d: d.score(), reverse=False)
+        all_delegates.sort(key=score_of, reverse=False)
 
         self.delegate_widgets.clear()
-        for delegate in all_delegates:
-            delegate_frame = QWidget()
-            delegate_layout = QHBoxLayout(delegate_frame)
-
+        for row, delegate in enumerate(all_delegates):
             code_label = QLabel(f"{delegate.code}")
-            code_label.setFont(QFont("Arial", 12))
             code_label.setFixedWidth(80)
 
             name_label = QLabel(f"{delegate.surname} {delegate.name}")
-            name_label.setFont(QFont("Arial", 12))
             name_label.setFixedWidth(180)
 
             speech_count = QLabel(f"{delegate.speech_count()}")
-            speech_count.setFont(QFont("Arial", 12))
             speech_count.setFixedWidth(100)
 
-            score_label = QLabel(f"{delegate.score():.2f}")
-            score_label.setFont(QFont("Arial", 12))
+            score_label = QLabel(f"{score_of(delegate):.2f}")
             score_label.setFixedWidth(100)
 
-            delegate_layout.addWidget(code_label)
-            delegate_layout.addWidget(name_label)
-            delegate_layout.addWidget(speech_count)
-            delegate_layout.addWidget(score_label)
-            delegate_layout.addStretch()
-
-            inner_layout.addWidget(delegate_frame)
+            inner_layout.addWidget(code_label, row, 0)
+            inner_layout.addWidget(name_label, row, 1)
+            inner_layout.addWidget(speech_count, row, 2)
+            inner_layout.addWidget(score_label, row, 3)
 
-        inner_widget.setLayout(inner_layout)
+        inner_layout.setColumnStretch(4, 1)
+        inner_layout.setRowStretch(len(all_delegates), 1)
         self.scroll.setWidget(inner_widget)
         self.general_layout.addWidget(self.scroll)
 
@@ -137,7 +178,7 @@ class GeneralTab(QWidget):
             item = self.general_layout.takeAt(0)
             widget = item.widget()
             if widget is not None:
-                widget.setParent(None)
+                widget.deleteLater()  # setParent(None) would restyle the whole old tree first
 
         self.init_ui()  # Reinitialize the UI to refresh the delegate list
 
@@ -180,73 +221,58 @@ class CommitteesTab(QWidget):
 
         for i, (name, committee) in enumerate(self.committee_list):
             header_label = QLabel(f"Committee: {name}")
-            header_label.setFont(QFont("Arial", 18, QFont.Bold))
+            header_label.setObjectName("committeeTitle")  # Styled by the app sheet
 
             title_container = QWidget()
             title_layout = QVBoxLayout(title_container)
             title_layout.setContentsMargins(0, 0, 0, 0)
             title_layout.addWidget(header_label)
-            title_container.setStyleSheet("""
-                border: 2px solid #5E81AC;
-                border-radius: 8px;
-                padding: 10px;
-                margin-bottom: 10px;
-            """)
 
             scroll_inner = QScrollArea()
             scroll_inner.setWidgetResizable(True)
             scroll_inner.setFixedHeight(300)
 
+            # Header and rows share one grid (see GeneralTab.init_ui)
             inner_widget = QWidget()
-            inner_layout = QVBoxLayout(inner_widget)
-
-            header_row = QWidget()
-            header_layout = QHBoxLayout(header_row)
+            inner_layout = QGridLayout(inner_widget)
+            inner_layout.setContentsMargins(ROW_MARGINS)
+            inner_layout.setHorizontalSpacing(ROW_COLUMN_SPACING)
+            inner_layout.setVerticalSpacing(ROW_SPACING)
 
             code_header = QLabel("Code")
-            code_header.setFont(QFont("Arial", 12, QFont.Bold))
+            code_header.setObjectName("columnHeader")
             code_header.setFixedWidth(80)
 
             name_header = QLabel("Name")
-            name_header.setFont(QFont("Arial", 12, QFont.Bold))
+            name_header.setObjectName("columnHeader")
             name_header.setFixedWidth(180)
 
             score_header = QLabel("Score")
-            score_header.setFont(QFont("Arial", 12, QFont.Bold))
+            score_header.setObjectName("columnHeader")
             score_header.setFixedWidth(100)
 
-            header_layout.addWidget(code_header)
-            header_layout.addWidget(name_header)
-            header_layout.addWidget(score_header)
-            header_layout.addStretch()
-
-            inner_layout.addWidget(header_row)
+            inner_layout.addWidget(code_header, 0, 0)
+            inner_layout.addWidget(name_header, 0, 1)
+            inner_layout.addWidget(score_header, 0, 2)
 
-            sorted_delegates = sorted(committee.delegates, key=lambda d: d.score())
-
-            for delegate in sorted_delegates:
-                delegate_frame = QWidget()
-                delegate_layout = QHBoxLayout(delegate_frame)
+            sorted_delegates = sorted(committee.delegates, key=score_of)
 
+            for row, delegate in enumerate(sorted_delegates, 1):
                 code_label = QLabel(f"{delegate.code}")
-                code_label.setFont(QFont("Arial", 12))
                 code_label.setFixedWidth(80)
 
                 name_label = QLabel(f"{delegate.surname} {delegate.name}")
-                name_label.setFont(QFont("Arial", 12))
                 name_label.setFixedWidth(180)
 
-                score_label = QLabel(f"{delegate.score():.2f}")
-                score_label.setFont(QFont("Arial", 12))
+                score_label = QLabel(f"{score_of(delegate):.2f}")
                 score_label.setFixedWidth(100)
 
-                delegate_layout.addWidget(code_label)
-                delegate_layout.addWidget(name_label)
-                delegate_layout.addWidget(score_label)
-                delegate_layout.addStretch()
-
-                inner_layout.addWidget(delegate_frame)
+                inner_layout.addWidget(code_label, row, 0)
+                inner_layout.addWidget(name_label, row, 1)
+                inner_layout.addWidget(score_label, row, 2)
 
+            inner_layout.setColumnStretch(3, 1)
+            inner_layout.setRowStretch(len(sorted_delegates) + 1, 1)
             scroll_inner.setWidget(inner_widget)
 
             committee_container = QWidget()
@@ -279,14 +305,191 @@ class CommitteesTab(QWidget):
 
 
 
+class SpeechHistoryModel(QAbstractListModel):
+    """List model over the session speech log.
+
+    Rows only hold speech ids; the display text is formatted when a row is
+    painted. Every speech is indexed by delegate code, committee, school and
+    type, so a filter is a lookup (plus an intersection when combined)
+    rather than a scan of the log.
+    """
+
+    FIELDS = ("delegate", "committee", "school", "type")
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._all = []      # Every speech id, ascending
+        self._index = {}    # (field, value) -> ascending speech ids
+        self._keys = {}     # speech id -> its index keys
+        self._filters = {}  # field -> value
+        self._rows = self._all
+        self.reload()
+
+    @staticmethod
+    def keys_of(speech):
+        delegate = speech["delegate"]
+        return (
+            ("delegate", delegate.code),
+            ("committee", delegate.committee_name),
+            ("school", delegate.school_name),
+            ("type", speech["type"]),
+        )
+
+    @staticmethod
+    def format_speech(speech):
+        delegate = speech["delegate"]
+        return f"{delegate.code} {delegate.name} {delegate.surname} ({delegate.school_name}): {speech['type'].value}"
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        speech_id = self._rows[index.row()]
+        if role == Qt.DisplayRole:
+            speech = find_speech(speech_id)
+            return self.format_speech(speech) if speech is not None else None
+        if role == Qt.UserRole:
+            return speech_id
+        return None
+
+    def speech_id(self, row):
+        return self._rows[row]
+
+    def values(self, field):
+        """Values of `field` that have at least one speech, sorted (speech
+        types in SpeechType order)."""
+        values = [value for key_field, value in self._index if key_field == field and self._index[(key_field, value)]]
+        if field == "type":
+            order = list(SpeechType)
+            return sorted(values, key=order.index)
+        return sorted(values)
+
+    def reload(self):
+        """Rebuild rows and indexes from the speech log."""
+        self.beginResetModel()
+        self._all.clear()
+        self._index.clear()
+        self._keys.clear()
+        for speech in speech_log:  # Already in id order: plain appends keep the indexes sorted
+            self._all.append(speech["id"])
+            keys = self.keys_of(speech)
+            self._keys[speech["id"]] = keys
+            for key in keys:
+                self._index.setdefault(key, []).append(speech["id"])
+        self._apply_filters()
+        self.endResetModel()
+
+    def set_filter(self, field, value=None):
+        """Show only the speeches whose `field` equals `value` (None clears it)."""
+        if value is None:
+            self._filters.pop(field, None)
+        else:
+            self._filters[field] = value
+        self.beginResetModel()
+        self._apply_filters()
+        self.endResetModel()
+
+    def clear_filters(self):
+        self._filters.clear()
+        self.beginResetModel()
+        self._apply_filters()
+        self.endResetModel()
+
+    def sync(self, speech_ids):
+        """Insert, refresh or drop the rows of speeches that changed."""
+        for speech_id in speech_ids:
+            speech = find_speech(speech_id)
+            for key in self._keys.pop(speech_id, ()):
+                ids = self._index[key]
+                ids.pop(bisect_left(ids, speech_id))
+            if speech is not None:
+                self._add_keys(speech)
+
+            filtered = self._rows is not self._all
+            self._place(self._all, speech_id, speech is not None, notify=not filtered)
+            if filtered:
+                keys = self._keys.get(speech_id, ())
+                matches = all((field, value) in keys for field, value in self._filters.items())
+                self._place(self._rows, speech_id, matches, notify=True)
+
+    def _add_keys(self, speech):
+        keys = self.keys_of(speech)
+        self._keys[speech["id"]] = keys
+        for key in keys:
+            insort(self._index.setdefault(key, []), speech["id"])
+
+    def _apply_filters(self):
+        if not self._filters:
+            self._rows = self._all
+            return
+        # Start from the most selective index and intersect the others
+        candidates = sorted((self._index.get(key, []) for key in self._filters.items()), key=len)
+        rows = candidates[0]
+        for other in candidates[1:]:
+            other = set(other)
+            rows = [speech_id for speech_id in rows if speech_id in other]
+        self._rows = list(rows)
+
+    def _place(self, rows, speech_id, present, notify):
+        row = bisect_left(rows, speech_id)
+        listed = row < len(rows) and rows[row] == speech_id
+        if present and not listed:
+            if notify:
+                self.beginInsertRows(QModelIndex(), row, row)
+            rows.insert(row, speech_id)
+            if notify:
+                self.endInsertRows()
+        elif listed and not present:
+            if notify:
+                self.beginRemoveRows(QModelIndex(), row, row)
+            rows.pop(row)
+            if notify:
+                self.endRemoveRows()
+        elif listed and notify:
+            index = self.index(row)
+            self.dataChanged.emit(index, index)
+
+
+class UndoKeyFilter(QObject):
+    """Hands the undo/redo keys of a text input to the Edit menu actions.
+
+    QLineEdit and QPlainTextEdit claim Ctrl+Z/Ctrl+Y through ShortcutOverride,
+    so the speech undo never fired while they had focus. With `text_first`
+    the input keeps the keys while it still has typing of its own to undo.
+    """
+
+    def __init__(self, widget, undo_action, redo_action, text_first=False):
+        super().__init__(widget)
+        self.widget = widget
+        self.undo_action = undo_action
+        self.redo_action = redo_action
+        self.text_first = text_first
+        widget.installEventFilter(self)
+
+    def eventFilter(self, watched, event):
+        if event.type() == QEvent.ShortcutOverride:
+            keys = QKeySequence(event.keyCombination())
+            for action in (self.undo_action, self.redo_action):
+                if keys in action.shortcuts():
+                    # Swallowing the override lets the key reach the action's shortcut
+                    return not (self.text_first and self.has_text_history(action))
+        return super().eventFilter(watched, event)
+
+    def has_text_history(self, action):
+        document = self.widget.document()
+        return document.isUndoAvailable() if action is self.undo_action else document.isRedoAvailable()
+
+
 class SpeechesTab(QWidget):
     def __init__(self, tab_widget, delegate_manager, window):
         super().__init__()
         self.delegate_manager = delegate_manager
         self.window = window
         
-        self.speeches = []
-        self.selected_index = None
+        self.history_model = SpeechHistoryModel(self)
+        self.selected_id = None  # Id of the speech being edited
 
         self.left_layout = QVBoxLayout()
         self.right_layout = QVBoxLayout()
@@ -301,14 +504,12 @@ class SpeechesTab(QWidget):
     def setup_ui(self):
         # --- Warning if no delegates ---
         self.warning_label = QLabel("⚠️ No delegates loaded. Please load a delegate file.")
-        self.warning_label.setFont(QFont("Arial", 11))
-        self.warning_label.setStyleSheet("color: red")
+        self.warning_label.setObjectName("warningLabel")
         self.warning_label.setWordWrap(True)
         self.left_layout.addWidget(self.warning_label)
      
         # --- Search Input ---
         search_label = QLabel("Enter Delegate Code:")
-        search_label.setFont(QFont("Arial", 12))
         self.left_layout.addWidget(search_label)
      
         self.code_input = QLineEdit()
@@ -317,7 +518,7 @@ class SpeechesTab(QWidget):
      
         # --- Name Display ---
         self.name_display_label = QLabel("")
-        self.name_display_label.setFont(QFont("Arial", 10, italic=True))
+        self.name_display_label.setObjectName("hintLabel")
         self.left_layout.addWidget(self.name_display_label)
      
         # --- Speech Type ---
@@ -344,21 +545,52 @@ class SpeechesTab(QWidget):
 
         # --- Score ---
         self.score_label = QLabel("Delegate Score: 0")
-        self.score_label.setFont(QFont("Arial", 12))
         self.left_layout.addWidget(self.score_label)
+
+        # --- Batch entry ---
+        batch_label = QLabel("Batch Entry:")
+        self.left_layout.addWidget(batch_label)
+
+        self.batch_input = QPlainTextEdit()
+        self.batch_input.setPlaceholderText(
+            "One speech per line (or separated by ;): code and type\n"
+            "e.g., 101 fu; 204 Opening speech; 118\n"
+            "(no type = the type selected above)"
+        )
+        self.left_layout.addWidget(self.batch_input)
+
+        self.batch_status = QLabel("")
+        self.batch_status.setObjectName("hintLabel")
+        self.batch_status.setWordWrap(True)
+        self.left_layout.addWidget(self.batch_status)
+
+        self.batch_button = QPushButton("✅ Commit Batch (Ctrl+Enter)")
+        self.batch_button.setEnabled(False)
+        self.left_layout.addWidget(self.batch_button)
      
         self.left_layout.addStretch()
      
         # --- History on the right ---
         history_label = QLabel("Speech History:")
-        history_label.setFont(QFont("Arial", 12))
         self.right_layout.addWidget(history_label)
      
-        self.speech_history = QListWidget()
+        # --- History filter ---
+        filter_layout = QHBoxLayout()
+        self.filter_field_dropdown = QComboBox()
+        self.filter_field_dropdown.addItems(["All", "Delegate", "Committee", "School", "Speech type"])
+        filter_layout.addWidget(self.filter_field_dropdown)
+
+        self.filter_value_dropdown = QComboBox()
+        self.filter_value_dropdown.setEditable(True)
+        self.filter_value_dropdown.setEnabled(False)
+        filter_layout.addWidget(self.filter_value_dropdown, stretch=1)
+        self.right_layout.addLayout(filter_layout)
+
+        self.speech_history = QListView()
+        self.speech_history.setModel(self.history_model)
+        self.speech_history.setUniformItemSizes(True)  # Rows are never measured one by one
         self.right_layout.addWidget(self.speech_history)
      
-        self.right_layout.addStretch()
-     
         # Layouts
         self.main_layout.addLayout(self.left_layout, stretch=1)
         self.main_layout.addLayout(self.right_layout, stretch=2)
@@ -368,17 +600,26 @@ class SpeechesTab(QWidget):
         self.code_input.textChanged.connect(self.update_delegate_name)
         self.add_button.clicked.connect(self.add_speech)
         self.delegate_manager.delegates_updated.connect(self.update_warning_visibility)
-        self.speech_history.itemClicked.connect(self.select_speech_for_edit)
+        self.speech_history.clicked.connect(self.select_speech_for_edit)
         self.edit_button.clicked.connect(self.apply_edit)
         self.delete_button.clicked.connect(self.delete_speech)
         self.cancel_button.clicked.connect(self.cancel_edit)
+        self.delegate_manager.speeches_changed.connect(self.sync_history)
+        self.delegate_manager.delegates_updated.connect(self.history_model.reload)
+        self.filter_field_dropdown.currentIndexChanged.connect(self.update_filter_values)
+        self.filter_value_dropdown.currentTextChanged.connect(self.apply_filter)
+        self.batch_input.textChanged.connect(self.validate_batch)
+        self.speech_type_dropdown.currentIndexChanged.connect(self.validate_batch)
+        self.batch_button.clicked.connect(self.commit_batch)
+        for keys in ("Ctrl+Return", "Ctrl+Enter"):
+            QShortcut(QKeySequence(keys), self.batch_input, self.commit_batch)
 
     def update_delegate_name(self):
         code = self.code_input.text().strip().upper()
         delegate = delegates.get(code)
         if delegate:
             self.name_display_label.setText(f"{delegate.code} {delegate.name} {delegate.surname}")
-            self.score_label.setText(f"Delegate Score: {delegate.score():.2f}")
+            self.score_label.setText(f"Delegate Score: {score_of(delegate):.2f}")
         else:
             self.name_display_label.setText("")
             self.score_label.setText("Delegate Score: 0")
@@ -393,14 +634,9 @@ class SpeechesTab(QWidget):
             return
 
         speech_type = SpeechType(speech_text)
-        delegate.speak(speech_type)
+        self.delegate_manager.execute(Speak(delegate, speech_type))
 
-        # Save for future editing
-        self.speeches.append((code, speech_type))
-        self.speech_history.addItem(f"{delegate.code} {delegate.name} {delegate.surname} ({delegate.school_name}): {speech_type.value}")
-
-        self.score_label.setText(f"Delegate Score: {delegate.score():.2f}")
-        self.delegate_manager.update_score()
+        self.score_label.setText(f"Delegate Score: {score_of(delegate):.2f}")
 
         QMessageBox.information(self.window, "Speech Added", f"{speech_type.value} added to {delegate.code} {delegate.name} {delegate.surname}.")
 
@@ -408,13 +644,43 @@ class SpeechesTab(QWidget):
         self.code_input.clear()
         self.speech_type_dropdown.setCurrentIndex(0)
 
-    def select_speech_for_edit(self, item):
-        self.selected_index = self.speech_history.row(item)
-        code, speech_type = self.speeches[self.selected_index]
+    def stage_batch(self):
+        """Parse the batch box; the selected speech type fills missing types."""
+        default_type = SpeechType(self.speech_type_dropdown.currentText())
+        return parse_speech_lines(self.batch_input.toPlainText(), default_type)
+
+    def validate_batch(self):
+        staged, errors = self.stage_batch()
+        if errors:
+            shown = "\n".join(f"Line {number}: {message}" for number, _, message in errors[:5])
+            more = f"\n... and {len(errors) - 5} more" if len(errors) > 5 else ""
+            self.batch_status.setText(f"⚠️ {len(errors)} invalid entr{'y' if len(errors) == 1 else 'ies'}:\n{shown}{more}")
+        elif staged:
+            self.batch_status.setText(f"{len(staged)} speech{'es' if len(staged) > 1 else ''} staged.")
+        else:
+            self.batch_status.setText("")
+        self.batch_button.setEnabled(bool(staged) and not errors)
+
+    def commit_batch(self):
+        """Record every staged speech as one undoable change."""
+        staged, errors = self.stage_batch()
+        if errors or not staged:
+            return
+
+        command = Batch([Speak(delegate, speech_type) for delegate, speech_type in staged],
+                        label=f"Add {len(staged)} speeches")
+        self.delegate_manager.execute(command)  # One history sync and one score refresh
+
+        self.batch_input.clear()
+        self.batch_status.setText(f"✅ {len(staged)} speech{'es' if len(staged) > 1 else ''} added.")
+
+    def select_speech_for_edit(self, index):
+        self.selected_id = self.history_model.speech_id(index.row())
+        speech = find_speech(self.selected_id)
 
         # Set input fields based on selected speech
-        self.code_input.setText(code)
-        self.speech_type_dropdown.setCurrentText(speech_type.value)
+        self.code_input.setText(speech["delegate"].code)
+        self.speech_type_dropdown.setCurrentText(speech["type"].value)
 
         # Show Edit and Delete buttons, hide Add button
         self.edit_button.setVisible(True)
@@ -425,7 +691,8 @@ class SpeechesTab(QWidget):
         
     def deselect_speech(self):
         # Clear selection
-        self.selected_index = None
+        self.selected_id = None
+        self.speech_history.clearSelection()
 
         # Clear input fields
         self.code_input.clear()
@@ -434,46 +701,37 @@ class SpeechesTab(QWidget):
         # Hide Edit and Delete buttons, show Add button
         self.edit_button.setVisible(False)
         self.delete_button.setVisible(False)
+        self.cancel_button.setVisible(False)
         self.add_button.setVisible(True)
 
 
     def apply_edit(self):
-        if self.selected_index is None:
+        if self.selected_id is None:
             return
 
         new_code = self.code_input.text().strip().upper()
         new_speech_text = self.speech_type_dropdown.currentText()
         new_speech_type = SpeechType(new_speech_text)
 
-        old_code, old_speech_type = self.speeches[self.selected_index]
-        old_delegate = delegates.get(old_code)
-        if old_delegate:
-            old_delegate.unspeak(old_speech_type)
-
         new_delegate = delegates.get(new_code)
         if new_delegate is None:
             QMessageBox.warning(self.window, "Delegate Not Found", f"No delegate found with code: {new_code}")
             return
 
-        new_delegate.speak(new_speech_type)
-        self.speeches[self.selected_index] = (new_code, new_speech_type)
-
-        self.speech_history.item(self.selected_index).setText(
-            f"{new_delegate.code} {new_delegate.name} {new_delegate.surname} ({new_delegate.school_name}): {new_speech_type.value}"
-        )
+        speech = find_speech(self.selected_id)
+        self.delegate_manager.execute(EditSpeech(speech, new_delegate, new_speech_type))
 
-        self.score_label.setText(f"Delegate Score: {new_delegate.score():.2f}")
-        self.delegate_manager.update_score()
+        self.score_label.setText(f"Delegate Score: {score_of(new_delegate):.2f}")
 
         self.edit_button.setVisible(False)
         self.delete_button.setVisible(False)
-        self.selected_index = None
+        self.selected_id = None
         
     def cancel_edit(self):
         # If a speech was selected, revert to the previous state (no changes)
-        code, speech_type = self.speeches[self.selected_index]
-        self.code_input.setText(code)
-        self.speech_type_dropdown.setCurrentText(speech_type.value)
+        speech = find_speech(self.selected_id)
+        self.code_input.setText(speech["delegate"].code)
+        self.speech_type_dropdown.setCurrentText(speech["type"].value)
     
         # Hide Edit, Delete, and Cancel buttons, show Add button
         self.edit_button.setVisible(False)
@@ -481,37 +739,75 @@ class SpeechesTab(QWidget):
         self.cancel_button.setVisible(False)
         self.add_button.setVisible(True)
     
-        # Reset selected index
-        self.selected_index = None
+        # Reset selected speech
+        self.selected_id = None
 
 
     def delete_speech(self):
-        if self.selected_index is None:
+        if self.selected_id is None:
             return
 
-        code, speech_type = self.speeches.pop(self.selected_index)
-        delegate = delegates.get(code)
-        if delegate:
-            delegate.unspeak(speech_type)
-
-        self.speech_history.takeItem(self.selected_index)
-        self.delegate_manager.update_score()
+        speech = find_speech(self.selected_id)
+        self.delegate_manager.execute(Unspeak(speech))
 
         self.code_input.clear()
         self.name_display_label.clear()
         self.score_label.setText("Delegate Score: 0")
         self.edit_button.setVisible(False)
         self.delete_button.setVisible(False)
-        self.selected_index = None
+        self.selected_id = None
 
     def update_warning_visibility(self):
         self.warning_label.setVisible(len(delegates) == 0)
 
+    def sync_history(self, speech_ids):
+        """Insert, update or drop the history rows of the given speeches."""
+        self.history_model.sync(speech_ids)
+
+        # An undo may have removed or changed the speech being edited
+        if self.selected_id is not None:
+            self.deselect_speech()
+
+    def update_filter_values(self):
+        """Offer the values of the chosen filter field."""
+        field = self.filter_field()
+        self.filter_value_dropdown.blockSignals(True)
+        try:
+            self.filter_value_dropdown.clear()
+            if field is not None:
+                values = self.history_model.values(field)
+                self.filter_value_dropdown.addItems([v.value if field == "type" else v for v in values])
+                self.filter_value_dropdown.setCurrentIndex(-1)
+        finally:
+            self.filter_value_dropdown.blockSignals(False)
+        self.filter_value_dropdown.setEnabled(field is not None)
+        self.history_model.clear_filters()
+
+    def apply_filter(self, text):
+        field = self.filter_field()
+        if field is None:
+            return
+        value = text.strip() or None
+        if field == "delegate" and value:
+            value = value.upper()
+        elif field == "type" and value:
+            try:
+                value = SpeechType(value)
+            except ValueError:
+                value = None
+        self.history_model.set_filter(field, value)
+
+    def filter_field(self):
+        """Model field of the filter dropdown (None for "All")."""
+        index = self.filter_field_dropdown.currentIndex()
+        return SpeechHistoryModel.FIELDS[index - 1] if index > 0 else None
+
 
 class StatisticsTab(QWidget):
     def __init__(self, delegate_manager):
         super().__init__()
-        self.layout = QHBoxLayout(self)
+        self.layout = QVBoxLayout(self)
+        charts_layout = QHBoxLayout()
 
         # Create two figures
         self.school_figure = Figure(figsize=(5, 5))
@@ -520,8 +816,16 @@ class StatisticsTab(QWidget):
         self.school_canvas = FigureCanvas(self.school_figure)
         self.committee_canvas = FigureCanvas(self.committee_figure)
 
-        self.layout.addWidget(self.school_canvas)
-        self.layout.addWidget(self.committee_canvas)
+        charts_layout.addWidget(self.school_canvas)
+        charts_layout.addWidget(self.committee_canvas)
+        self.layout.addLayout(charts_layout, stretch=2)
+
+        # Rolling timeline: lines are created once and only their data changes
+        self.timeline_figure = Figure(figsize=(10, 3))
+        self.timeline_canvas = FigureCanvas(self.timeline_figure)
+        self.timeline_ax = None
+        self.timeline_lines = {}
+        self.layout.addWidget(self.timeline_canvas, stretch=1)
 
         # Draw initial plots
         self.update_plots()
@@ -529,19 +833,49 @@ class StatisticsTab(QWidget):
         # Connect to signal
         delegate_manager.score_updated.connect(self.update_plots)
 
+        # Keep the window rolling even when nobody speaks
+        self.timeline_timer = QTimer(self)
+        self.timeline_timer.timeout.connect(self.plot_timeline)
+        self.timeline_timer.start(30_000)
+
     def update_plots(self):
         self.plot_school_speeches()
         self.plot_committee_speeches()
+        self.plot_timeline()
+
+    def plot_timeline(self):
+        """Speeches per committee per minute over the last TIMELINE_MINUTES."""
+        names = sorted(committees)
+        if self.timeline_ax is None or list(self.timeline_lines) != names:
+            # (Re)build the axes only when the committees change
+            self.timeline_figure.clear()
+            self.timeline_ax = self.timeline_figure.add_subplot(111)
+            self.timeline_ax.set_xlabel("Minutes ago")
+            self.timeline_ax.set_ylabel("Speeches / min")
+            self.timeline_ax.set_title(f"Last {TIMELINE_MINUTES} minutes per committee")
+            self.timeline_lines = {}
+            for name in names:
+                line, = self.timeline_ax.plot([], [], marker="o", label=name)
+                self.timeline_lines[name] = line
+            if names:
+                self.timeline_ax.legend(loc="upper left", fontsize="small", ncol=4)
+
+        now = monotonic()
+        for name, line in self.timeline_lines.items():
+            offsets, rates = timeline.rate("committee", name, TIMELINE_MINUTES, TIMELINE_BUCKET_MINUTES, now)
+            line.set_data(offsets, rates)
+
+        self.timeline_ax.set_xlim(-TIMELINE_MINUTES, 0)
+        self.timeline_ax.relim()
+        self.timeline_ax.autoscale_view(scalex=False)
+        self.timeline_figure.tight_layout()
+        self.timeline_canvas.draw_idle()
 
     def plot_school_speeches(self):
         self.school_figure.clear()
         ax = self.school_figure.add_subplot(111)
 
-        school_speech_counts = {school_name: 0 for school_name in schools.keys()}
-        for committee in committees.values():
-            for delegate in committee.delegates:
-                if delegate.school_name in school_speech_counts:
-                    school_speech_counts[delegate.school_name] += len(delegate.speeches)
+        school_speech_counts = {name: school.speech_count() for name, school in schools.items()}
 
         school_names = list(school_speech_counts.keys())
         counts = list(school_speech_counts.values())
@@ -564,10 +898,7 @@ class StatisticsTab(QWidget):
         self.committee_figure.clear()
         ax = self.committee_figure.add_subplot(111)
 
-        committee_speech_counts = {}
-        for name, committee in committees.items():
-            total = sum(len(delegate.speeches) for delegate in committee.delegates)
-            committee_speech_counts[name] = total
+        committee_speech_counts = {name: committee.speech_count() for name, committee in committees.items()}
 
         committee_names = list(committee_speech_counts.keys())
         counts = list(committee_speech_counts.values())
@@ -596,10 +927,37 @@ class SettingsMenu(QMenu):
         load_action.triggered.connect(self.load_participants_from_file)
         self.addAction(load_action)
 
+        import_action = QAction("Import Roster Folder", self)
+        import_action.triggered.connect(self.import_roster_folder)
+        self.addAction(import_action)
+
+        export_action = QAction("Export Results", self)
+        export_action.triggered.connect(self.export_results)
+        self.addAction(export_action)
+
+        archive_action = QAction("Archive Session", self)
+        archive_action.triggered.connect(self.archive_session)
+        self.addAction(archive_action)
+
+        # Scoring policy, one checkable entry per registered policy
+        policy_menu = self.addMenu("Scoring Policy")
+        self.policy_group = QActionGroup(self)
+        for name in POLICIES:
+            policy_action = QAction(name, self, checkable=True)
+            policy_action.setChecked(POLICIES[name] is get_policy())
+            policy_action.triggered.connect(lambda checked, name=name: self.select_policy(name))
+            self.policy_group.addAction(policy_action)
+            policy_menu.addAction(policy_action)
+
         theme_toggle_action = QAction("Toggle Light/Dark Theme", self)
         theme_toggle_action.triggered.connect(self.toggle_theme)
         self.addAction(theme_toggle_action)
 
+        self.scoreboard_server = ScoreboardServer(host="0.0.0.0")
+        self.scoreboard_action = QAction("Start Scoreboard Server", self)
+        self.scoreboard_action.triggered.connect(self.toggle_scoreboard)
+        self.addAction(self.scoreboard_action)
+
     def load_participants_from_file(self):
         file_path, _ = QFileDialog.getOpenFileName(
             self, "Select Participants Excel File", "", "Excel Files (*.xlsx);;All Files (*)"
@@ -612,21 +970,98 @@ class SettingsMenu(QMenu):
             else:
                 QMessageBox.warning(self, "Error", "Failed to load delegates.")
 
+    def import_roster_folder(self):
+        folder = QFileDialog.getExistingDirectory(self, "Select Folder with Roster Files")
+        if not folder:
+            return
+
+        filepaths = sorted(glob.glob(os.path.join(folder, "*.xlsx")))
+        if not filepaths:
+            QMessageBox.warning(self, "Error", "No Excel files found in the selected folder.")
+            return
+
+        result = load_rosters(filepaths)
+        if result.delegates:
+            self.delegate_manager.set_delegates(list(delegates.values()))
+
+        message = f"Imported {result}."
+        if result.errors:
+            message += "\n\nFiles with errors:\n" + "\n".join(
+                f"{os.path.basename(path)}: {error}" for path, error in result.errors.items()
+            )
+        if result.errors or not result.delegates:
+            QMessageBox.warning(self, "Import", message)
+        else:
+            QMessageBox.information(self, "Import", message)
+
+    def export_results(self):
+        file_path, _ = QFileDialog.getSaveFileName(
+            self, "Export Results", "results.xlsx",
+            "Excel Workbook (*.xlsx);;CSV Files (*.csv);;Parquet Files (*.parquet)"
+        )
+        if not file_path:
+            return
+
+        try:
+            written = export_session(file_path)
+        except (ImportError, ValueError, OSError) as e:
+            QMessageBox.warning(self, "Error", f"Export failed: {e}")
+            return
+        QMessageBox.information(self, "Export", "Results exported to:\n" + "\n".join(written))
+
+    def archive_session(self):
+        file_path, _ = QFileDialog.getSaveFileName(
+            self, "Select Session Archive", "archive.sqlite",
+            "SQLite Archive (*.sqlite *.db);;All Files (*)",
+            options=QFileDialog.DontConfirmOverwrite  # Sessions are appended
+        )
+        if not file_path:
+            return
+        name, ok = QInputDialog.getText(self, "Archive Session", "Session name:")
+        if not ok or not name.strip():
+            return
+
+        try:
+            with Archive(file_path) as archive:
+                archive.add_session(name.strip())
+        except (sqlite3.Error, OSError) as e:
+            QMessageBox.warning(self, "Error", f"Could not archive the session: {e}")
+            return
+        QMessageBox.information(self, "Archive", f"Session '{name.strip()}' archived to {file_path}.")
+
+    def select_policy(self, name):
+        set_policy(name)
+        self.delegate_manager.update_score()
+
     def toggle_theme(self):
         """Toggle between light and dark themes."""
-        current_stylesheet = self.app.styleSheet()
-        if qdarktheme.load_stylesheet("light") == current_stylesheet:
-            self.app.setStyleSheet(qdarktheme.load_stylesheet())  # Dark theme
-        else:
-            self.app.setStyleSheet(qdarktheme.load_stylesheet("light"))  # Light theme
+        toggle_theme(self.app)
+
+    def toggle_scoreboard(self):
+        """Start or stop the read-only HTTP scoreboard."""
+        if self.scoreboard_server.is_running():
+            self.scoreboard_server.stop()
+            self.scoreboard_action.setText("Start Scoreboard Server")
+            return
+
+        try:
+            self.scoreboard_server.start()
+        except OSError as e:
+            QMessageBox.warning(self, "Error", f"Could not start the scoreboard: {e}")
+            return
+        self.scoreboard_action.setText("Stop Scoreboard Server")
+        QMessageBox.information(
+            self, "Scoreboard",
+            f"Scoreboard available on port {self.scoreboard_server.port} of this computer."
+        )
 
 
 def launch_gui():
     # Create the QApplication instance
     app = QApplication([])
 
-    # Apply light theme to Qt application by default
-    app.setStyleSheet(qdarktheme.load_stylesheet())
+    # Apply dark theme (cached sheet, fonts included) by default
+    apply_theme(app, "dark")
 
     # Create the main window
     window = QMainWindow()
@@ -639,9 +1074,8 @@ def launch_gui():
 
     # Title Section
     title = QLabel("Welcome to MEPGest!")
-    title.setFont(QFont("Arial", 28, QFont.Bold))
     title.setAlignment(Qt.AlignCenter)
-    title.setStyleSheet("color: #E5E9F0;")  # Light Icy White for Title Text
+    title.setObjectName("appTitle")  # Light Icy White for Title Text
     layout.addWidget(title)
 
     # Tabs Section
@@ -666,6 +1100,25 @@ def launch_gui():
     settings_menu = SettingsMenu(app, delegate_manager)  # Pass the app instance to the menu
     menu_bar.addMenu(settings_menu)
 
+    # Edit menu with undo/redo of speech changes
+    edit_menu = menu_bar.addMenu("Edit")
+    undo_action = QAction("Undo", window)
+    undo_action.setShortcut(QKeySequence.Undo)
+    undo_action.triggered.connect(delegate_manager.undo)
+    edit_menu.addAction(undo_action)
+
+    redo_action = QAction("Redo", window)
+    redo_keys = QKeySequence.keyBindings(QKeySequence.Redo)
+    if QKeySequence("Ctrl+Y") not in redo_keys:  # Already there on some platforms; twice is ambiguous
+        redo_keys.append(QKeySequence("Ctrl+Y"))
+    redo_action.setShortcuts(redo_keys)
+    redo_action.triggered.connect(delegate_manager.redo)
+    edit_menu.addAction(redo_action)
+
+    # The speech inputs would otherwise keep Ctrl+Z/Ctrl+Y for their own text
+    UndoKeyFilter(speeches_tab.code_input, undo_action, redo_action)
+    UndoKeyFilter(speeches_tab.batch_input, undo_action, redo_action, text_first=True)
+
     # Add a toolbar with the theme toggle action
     toolbar = QToolBar(window)
     window.addToolBar(toolbar)
@@ -678,5 +1131,6 @@ def launch_gui():
     # Set the central widget and show the window
     window.setCentralWidget(central_widget)
     window.show()
+    QTimer.singleShot(0, preload)  # Build the other theme while idle, not on the first toggle
 
     app.exec()
\ No newline at end of file
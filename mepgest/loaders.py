@@ -1,7 +1,58 @@
 import pandas as pd
 from tqdm import tqdm
-from mepgest.models import Delegate, schools, committees, assign_delegate_codes
+from mepgest.models import Delegate, schools, committees, assign_delegate_codes, assign_new_codes
+from concurrent.futures import ProcessPoolExecutor
+import os
 import re
+import unicodedata
+
+REQUIRED_COLUMNS = ["Name", "Surname", "Gender", "Committee", "School"]
+
+
+def clean_row(name, surname, gender, committee, raw_school):
+    """Normalise the raw cells of a roster row into Delegate arguments."""
+    raw_school = str(raw_school).strip()
+
+    # Extract school name from quotes, if present
+    match = re.search(r'"(.*?)"', raw_school)
+    school = match.group(1).strip() if match else raw_school.title()
+
+    return {
+        "name": str(name).strip().title(),
+        "surname": str(surname).strip().title(),
+        "gender": str(gender).strip(),
+        "committee_name": str(committee).strip(),
+        "school_name": school,
+    }
+
+
+def parse_roster(filepath):
+    """Read one roster file into Delegate argument dicts, without touching the session.
+
+    Returns (filepath, rows, error). Safe to run in a worker process.
+    """
+    try:
+        df = pd.read_excel(filepath)
+    except Exception as e:
+        return filepath, [], str(e)
+
+    missing = set(REQUIRED_COLUMNS) - set(df.columns)
+    if missing:
+        return filepath, [], f"Excel file is missing required columns: {missing}"
+
+    rows = [clean_row(*values) for values in df[REQUIRED_COLUMNS].itertuples(index=False, name=None)]
+    return filepath, rows, None
+
+
+def roster_key(name, surname, school_name):
+    """Key of the duplicate index: accents, case and spacing are ignored."""
+    def normalise(text):
+        text = unicodedata.normalize("NFKD", text)
+        text = "".join(c for c in text if not unicodedata.combining(c))
+        return " ".join(text.casefold().split())
+
+    return normalise(name), normalise(surname), normalise(school_name)
+
 
 def load_delegates(filepath, verbose=False):
     delegates = []  # List to collect Delegate objects
@@ -10,51 +61,114 @@ def load_delegates(filepath, verbose=False):
         df = pd.read_excel(filepath)
 
         # Check required columns
-        required_columns = {"Name", "Surname", "Gender", "Committee", "School"}
+        required_columns = set(REQUIRED_COLUMNS)
         if not required_columns.issubset(df.columns):
             raise ValueError(f"Excel file is missing required columns: {required_columns - set(df.columns)}")
 
         print(f"📥 Loading {len(df)} participants from {filepath}...\n")
-        for _, row in tqdm(df.iterrows(), total=len(df), desc="Loading delegates"):
-            name = str(row["Name"]).strip().title()
-            surname = str(row["Surname"]).strip().title()
-            gender = str(row["Gender"]).strip()
-            committee = str(row["Committee"]).strip()
-            
-            # Extract school name from quotes, if present
-            raw_school = str(row["School"]).strip()
-            match = re.search(r'"(.*?)"', raw_school)
-            school = match.group(1).strip() if match else raw_school.title()
-
+        for values in tqdm(df[REQUIRED_COLUMNS].itertuples(index=False, name=None), total=len(df), desc="Loading delegates"):
             # Create the delegate and append it to the list
-            delegate = Delegate(
-                name=name,
-                surname=surname,
-                gender=gender,
-                committee_name=committee,
-                school_name=school
-            )
+            delegate = Delegate(**clean_row(*values))
             delegates.append(delegate)  # Add the delegate to the list
-        
+
         # Call the function to assign codes (if needed)
         assign_delegate_codes()
 
         print("\n✅ Load complete.")
 
         if verbose:
-            unique_committees = sorted(committees.items())
-            unique_schools = sorted(schools.items())
-
-            print("\n🧭 Unique Committees:")
-            for name, committee in unique_committees:
-                print(f" - {name}: {len(committee.delegates)} delegates")
-
-            print("\n🏫 Unique Schools:")
-            for name, school in unique_schools:
-                print(f" - {name}: {len(school.delegates)} delegates")
+            print_summary()
 
         return delegates  # Return the list of delegates
 
     except Exception as e:
         print(f"❌ Error loading participants: {e}")
         return []  # Return an empty list if there was an error
+
+
+class RosterImport:
+    """Outcome of a bulk import: new delegates, skipped duplicates and per-file errors."""
+
+    def __init__(self):
+        self.delegates = []
+        self.duplicates = []  # (filepath, row, where the delegate was first seen)
+        self.errors = {}      # filepath -> message
+        self.files = 0
+
+    def __str__(self):
+        return (f"{len(self.delegates)} delegates from {self.files - len(self.errors)}/{self.files} files, "
+                f"{len(self.duplicates)} duplicates skipped")
+
+
+def load_rosters(filepaths, workers=None, verbose=False):
+    """Merge many roster files into the session.
+
+    Files are parsed in parallel on a process pool; rows are then merged in
+    file order, skipping anyone already in the session or in an earlier file
+    (same name, surname and school). Codes are assigned once at the end:
+    delegates already in the session keep theirs, new ones get the next free
+    codes of their committee.
+    """
+    filepaths = list(filepaths)
+    result = RosterImport()
+    result.files = len(filepaths)
+
+    seen = {}
+    for committee in committees.values():
+        for delegate in committee.delegates:
+            seen[roster_key(delegate.name, delegate.surname, delegate.school_name)] = "session"
+
+    if workers is None:
+        workers = min(len(filepaths), os.cpu_count() or 1)
+
+    print(f"📥 Importing {len(filepaths)} roster files with {max(workers, 1)} workers...\n")
+    if workers <= 1:
+        parsed = map(parse_roster, filepaths)
+        pool = None
+    else:
+        pool = ProcessPoolExecutor(max_workers=workers)
+        parsed = pool.map(parse_roster, filepaths, chunksize=max(len(filepaths) // (workers * 4), 1))
+
+    try:
+        for filepath, rows, error in tqdm(parsed, total=len(filepaths), desc="Importing rosters"):
+            if error is not None:
+                result.errors[filepath] = error
+                continue
+
+            for row in rows:
+                key = roster_key(row["name"], row["surname"], row["school_name"])
+                if key in seen:
+                    result.duplicates.append((filepath, row, seen[key]))
+                    continue
+                seen[key] = filepath
+                result.delegates.append(Delegate(**row))
+    finally:
+        if pool is not None:
+            pool.shutdown()
+
+    if result.delegates:
+        assign_new_codes(result.delegates)
+
+    for filepath, error in result.errors.items():
+        print(f"❌ {filepath}: {error}")
+    print(f"\n✅ Import complete: {result}.")
+
+    if verbose:
+        for filepath, row, first in result.duplicates:
+            print(f"🔁 {row['surname']} {row['name']} ({row['school_name']}) in {filepath}, already from {first}")
+        print_summary()
+
+    return result
+
+
+def print_summary():
+    unique_committees = sorted(committees.items())
+    unique_schools = sorted(schools.items())
+
+    print("\n🧭 Unique Committees:")
+    for name, committee in unique_committees:
+        print(f" - {name}: {len(committee.delegates)} delegates")
+
+    print("\n🏫 Unique Schools:")
+    for name, school in unique_schools:
+        print(f" - {name}: {len(school.delegates)} delegates")
@@ -14,7 +14,15 @@
 # IMPORT ZONE          #
 ########################
 
+from bisect import bisect_left, insort
+from collections import Counter
+from contextlib import contextmanager
+from itertools import count
+from threading import RLock
+from time import monotonic
+
 from mepgest.speech import SpeechType
+from mepgest.timeline import timeline
 
 
 ########################
@@ -24,33 +32,194 @@ from mepgest.speech import SpeechType
 committees = {} # Global
 schools = {}    # Global
 delegates = {}  # Global
+speech_log = [] # Global, every speech of the session ordered by id
+
+_speech_ids = count(1)
+_delegate_serials = count(1)
+_revision = 0   # Bumped on every change to the session
+_data_revision = 0  # Bumped only when delegates or speeches change
+_listeners = [] # Callables notified with the new revision
+_batch = {"depth": 0, "dirty": False, "data": False}
+_speech_observers = []  # Incremental indexes kept in step with every speech
+
+# Held by every mutation of the session; readers on other threads (the
+# scoreboard) take it to see a consistent session
+session_lock = RLock()
+
+
+def current_revision():
+    """Return the revision number of the live session."""
+    return _revision
+
+
+def data_revision():
+    """Return a revision that only moves when delegates or speeches change.
+
+    Settings such as the scoring policy bump current_revision() but not this
+    one, so caches built from the session data survive them.
+    """
+    return _data_revision
+
+
+def add_listener(callback):
+    """Register a callable invoked with the new revision after each change.
+
+    Listeners run on the thread that mutated the session, so they should
+    only hand the notification over (e.g. to an event loop) and return.
+    """
+    _listeners.append(callback)
+
+
+def remove_listener(callback):
+    if callback in _listeners:
+        _listeners.remove(callback)
+
+
+def add_speech_observer(observer):
+    """Register an object whose add(speech) and remove(speech) are called,
+    with the session lock held, every time a speech enters or leaves the session."""
+    _speech_observers.append(observer)
+
+
+def touch(data=True):
+    """Mark the session as changed and notify the listeners.
+
+    Pass data=False for changes that leave delegates and speeches untouched.
+    """
+    global _revision, _data_revision
+    if _batch["depth"]:
+        _batch["dirty"] = True  # Published once when the batch closes
+        _batch["data"] = _batch["data"] or data
+        return
+    if data:
+        _data_revision += 1
+    _revision += 1
+    for callback in list(_listeners):
+        callback(_revision)
+
+
+@contextmanager
+def batch():
+    """Group several changes into a single revision.
+
+    Inside the block the totals are updated as usual, but listeners (and
+    revision-keyed caches) only see one change, when the outermost block exits.
+    The session lock is held throughout, so other threads never see half a batch.
+    """
+    with session_lock:
+        _batch["depth"] += 1
+        try:
+            yield
+        finally:
+            _batch["depth"] -= 1
+            if not _batch["depth"] and _batch["dirty"]:
+                data = _batch["data"]
+                _batch["dirty"] = _batch["data"] = False
+                touch(data=data)
+
+
+def find_speech(speech_id):
+    """Return the speech record with the given id, or None."""
+    i = bisect_left(speech_log, speech_id, key=_speech_id)
+    if i < len(speech_log) and speech_log[i]["id"] == speech_id:
+        return speech_log[i]
+    return None
+
+
+def _speech_id(speech):
+    return speech["id"]
+
+
+class Group:
+    """Delegates sharing a committee or a school.
+
+    Counts, total and mean weight, the sorted member weights and the speech
+    type counts are updated by the delegates on every change, so none of the
+    statistics below needs to walk the members.
+    """
 
-class Committee:
     def __init__(self, name):
         self.name = name
         self.delegates = []
+        self._weight_sum = 0
+        self._mean_weight = 0
+        self._speech_count = 0
+        self._type_counts = Counter()
+        self._ranked = []   # (weight, serial) of every member, ascending
+        self._members = {}  # serial -> delegate
 
     def add_delegate(self, participant):
         self.delegates.append(participant)
+        self._members[participant._serial] = participant
+        insort(self._ranked, (participant.total_weight(), participant._serial))
+        self._weight_sum += participant.total_weight()
+        self._speech_count += participant.speech_count()
+        for speech in participant.speeches:
+            self._type_counts[speech["type"]] += 1
+        self._mean_weight = self._weight_sum / len(self.delegates)
+
+    def _speech_changed(self, delegate, old_weight, speech, sign):
+        # Called by the delegate after adding (sign=1) or removing (sign=-1) a speech
+        self._ranked.pop(bisect_left(self._ranked, (old_weight, delegate._serial)))
+        insort(self._ranked, (delegate.total_weight(), delegate._serial))
+        self._weight_sum += sign * speech["weight"]
+        self._mean_weight = self._weight_sum / len(self.delegates)
+        self._speech_count += sign
+        self._type_counts[speech["type"]] += sign
+
+    def delegate_count(self):
+        return len(self.delegates)
+
+    def speech_count(self):
+        return self._speech_count
 
     def total_weight(self):
-        return sum(delegate.total_weight() for delegate in self.delegates) / len(self.delegates)
+        """Mean speech weight per delegate."""
+        return self._mean_weight
+
+    def weight_sum(self):
+        return self._weight_sum
+
+    def weight_distribution(self):
+        """Member weights, ascending."""
+        return [weight for weight, _ in self._ranked]
+
+    def median_weight(self):
+        n = len(self._ranked)
+        if n == 0:
+            return 0
+        if n % 2:
+            return self._ranked[n // 2][0]
+        return (self._ranked[n // 2 - 1][0] + self._ranked[n // 2][0]) / 2
+
+    def top_speaker(self):
+        """Delegate with the highest weight (None if the group is empty)."""
+        if not self._ranked:
+            return None
+        return self._members[self._ranked[-1][1]]
+
+    def speech_type_counts(self):
+        return {speech_type: n for speech_type, n in self._type_counts.items() if n}
+
+    def statistics(self):
+        top = self.top_speaker()
+        return {
+            "delegates": self.delegate_count(),
+            "speeches": self.speech_count(),
+            "total_weight": self._weight_sum,
+            "mean_weight": self._mean_weight,
+            "median_weight": self.median_weight(),
+            "top_speaker": f"{top.surname} {top.name}" if top is not None and top.speeches else None,
+            "speech_types": {t.value: n for t, n in self.speech_type_counts().items()},
+        }
 
+
+class Committee(Group):
     def __str__(self):
         return f"Committee {self.name} with {len(self.delegates)} delegates"
     
     
-class School:
-    def __init__(self, name):
-        self.name = name
-        self.delegates = []
-
-    def add_delegate(self, participant):
-        self.delegates.append(participant)
-
-    def total_weight(self):
-        return sum(delegate.total_weight() for delegate in self.delegates) / len(self.delegates)
-
+class School(Group):
     def __str__(self):
         return f"School {self.name} with {len(self.delegates)} delegates"
 
@@ -64,60 +233,127 @@ class Delegate:
         self.school_name = school_name
         self.speeches = []
         self.code = 0
+        self._weight = 0
+        self._serial = next(_delegate_serials)
 
-        # Auto-register to committee
-        if committee_name not in committees:
-            committees[committee_name] = Committee(committee_name)
-        committees[committee_name].add_delegate(self)
+        with session_lock:
+            # Auto-register to committee
+            if committee_name not in committees:
+                committees[committee_name] = Committee(committee_name)
+            self.committee = committees[committee_name]
+            self.committee.add_delegate(self)
 
-        # Auto-register to school
-        if school_name not in schools:
-            schools[school_name] = Committee(school_name)
-        schools[school_name].add_delegate(self)
+            # Auto-register to school
+            if school_name not in schools:
+                schools[school_name] = School(school_name)
+            self.school = schools[school_name]
+            self.school.add_delegate(self)
         
-    def speak(self, speech_type, time=None):
+    def speak(self, speech_type, time=None, duration=None):
+        """Record a speech. `time` is a monotonic timestamp (default: now),
+        `duration` an optional length in seconds."""
         # Validate speech type and get weight
         weight = SpeechType.get_weight(speech_type)
-        self.speeches.append({
+        speech = {
+            "id": next(_speech_ids),
+            "delegate": self,
             "type": speech_type,
-            "weight": weight
-        })
-    
+            "weight": weight,
+            "time": monotonic() if time is None else time,
+            "duration": duration
+        }
+        self.add_speech(speech)
+        return speech
+
+    def add_speech(self, speech):
+        """Attach a speech record, either new or previously removed (undo)."""
+        with session_lock:
+            speech["delegate"] = self
+            insort(self.speeches, speech, key=_speech_id)
+            insort(speech_log, speech, key=_speech_id)
+            timeline.add(speech)
+            for observer in _speech_observers:
+                observer.add(speech)
+            self._update_totals(speech, 1)
+            touch()
+
+    def remove_speech(self, speech):
+        """Detach this exact speech record from the delegate and the log."""
+        with session_lock:
+            self.speeches.pop(bisect_left(self.speeches, speech["id"], key=_speech_id))
+            speech_log.pop(bisect_left(speech_log, speech["id"], key=_speech_id))
+            timeline.remove(speech)
+            for observer in _speech_observers:
+                observer.remove(speech)
+            self._update_totals(speech, -1)
+            touch()
+
     def unspeak(self, speech_type):
         # Find the speech with the correct type and remove it
         for speech in self.speeches:
             if speech['type'] == speech_type:
-                self.speeches.remove(speech)
-                break
+                self.remove_speech(speech)
+                return speech
+        return None
+
+    def _update_totals(self, speech, sign):
+        # Keep delegate, committee and school totals in step with one speech
+        old_weight = self._weight
+        self._weight += sign * speech["weight"]
+        self.committee._speech_changed(self, old_weight, speech, sign)
+        self.school._speech_changed(self, old_weight, speech, sign)
 
     def speech_count(self):
         return len(self.speeches)
 
     def total_weight(self):
-        return sum(speech["weight"] for speech in self.speeches)
+        return self._weight
     
     def score(self):
-        committee = committees.get(self.committee_name)
-        school = schools.get(self.school_name)
-        committee_weight = committee.total_weight() if committee else 0
-        school_weight = school.total_weight() if school else 0
-        
-        # TO DO
-        return self.total_weight() + committee_weight + school_weight
+        """Score under the default formula; see mepgest.scoring for the others."""
+        return self.total_weight() + self.committee.total_weight() + self.school.total_weight()
 
     def __str__(self):
-        return f"{self.name} {self.surname} from {self.school} ({self.committee_name})"
+        return f"{self.name} {self.surname} from {self.school_name} ({self.committee_name})"
 
 
 def assign_delegate_codes():
-    for committee_name, committee in sorted(committees.items()):
-        # Extract the number from the start of the committee name (e.g., "2 AFET" → 2)
-        committee_number = committee_name
+    with session_lock:
+        for committee_name, committee in sorted(committees.items()):
+            # Extract the number from the start of the committee name (e.g., "2 AFET" → 2)
+            committee_number = committee_name
         
-        # Sort delegates by surname and name
-        sorted_delegates = sorted(committee.delegates, key=lambda d: (d.surname.lower(), d.name.lower()))
-        for i, delegate in enumerate(sorted_delegates, start=1):
-            code = f"{committee_number}{i:02d}"
-            delegate.code = code
-            delegates[code] = delegate  # Add delegate to global delegates dictionary
+            # Sort delegates by surname and name
+            sorted_delegates = sorted(committee.delegates, key=lambda d: (d.surname.lower(), d.name.lower()))
+            for i, delegate in enumerate(sorted_delegates, start=1):
+                code = f"{committee_number}{i:02d}"
+                delegate.code = code
+                delegates[code] = delegate  # Add delegate to global delegates dictionary
+
+        touch()
+
+
+
+def assign_new_codes(new_delegates):
+    """Give `new_delegates` codes after the last one used in their committee.
+
+    Delegates that already have a code keep it, so speeches, exports and the
+    scoreboard keep referring to the same people. In a committee without
+    codes yet, this numbers the new delegates exactly as assign_delegate_codes().
+    """
+    with session_lock:
+        by_committee = {}
+        for delegate in new_delegates:
+            by_committee.setdefault(delegate.committee_name, []).append(delegate)
+
+        for committee_name, members in sorted(by_committee.items()):
+            used = [int(delegate.code[len(committee_name):])
+                    for delegate in committees[committee_name].delegates if delegate.code]
+            start = max(used, default=0) + 1
+            members.sort(key=lambda d: (d.surname.lower(), d.name.lower()))
+            for i, delegate in enumerate(members, start=start):
+                code = f"{committee_name}{i:02d}"
+                delegate.code = code
+                delegates[code] = delegate
 
+        touch()
@@ -0,0 +1,474 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# File: scoreboard.py
+# Created: 19-10-2026
+# Author: Lorenzo Calandra Buonaura <lorenzocb01@gmail.com>
+# Institution: APS Model European Parliament Italia
+#
+# Description: Read-only HTTP scoreboard served from the live session.
+#              Rankings are built once per session revision and shared by
+#              every client; plain requests are answered with ETags and
+#              304s, live clients follow a Server-Sent Events feed (or a
+#              long-poll) that only carries the rows that changed.
+#
+
+
+########################
+# IMPORT ZONE          #
+########################
+
+import argparse
+import asyncio
+import json
+import secrets
+import threading
+from collections import deque
+from http import HTTPStatus
+from urllib.parse import parse_qs
+
+from mepgest.models import session_lock, current_revision, add_listener, remove_listener
+from mepgest.scoring import ranking
+
+
+########################
+# CLASSES              #
+########################
+
+class Snapshot:
+    """Rankings of the session at a given revision, serialised once."""
+
+    __slots__ = ("revision", "rows", "body")
+
+    def __init__(self, revision, rows):
+        self.revision = revision
+        self.rows = rows  # code -> row, in rank order
+        self.body = json.dumps({
+            "revision": revision,
+            "rankings": list(rows.values()),
+        }).encode("utf-8")
+
+
+class Scoreboard:
+    """Caches the ranking snapshot and the diffs between recent snapshots.
+
+    Whatever the number of clients, the ranking is computed at most once
+    per revision and each diff at most once per (old, new) pair.
+    """
+
+    def __init__(self, history=16):
+        self._snapshot = None
+        self._history = deque(maxlen=history)
+        self._diffs = {}
+
+    def snapshot(self):
+        revision = current_revision()
+        if self._snapshot is None or self._snapshot.revision != revision:
+            # The GUI thread mutates the session: read revision and rows together
+            with session_lock:
+                revision = current_revision()
+                rows = build_rankings()
+            snapshot = Snapshot(revision, rows)
+            if self._snapshot is not None:
+                self._history.append(self._snapshot)
+            self._snapshot = snapshot
+            self._diffs = {}
+        return self._snapshot
+
+    def changes_since(self, revision):
+        """Return the JSON diff from `revision` to now.
+
+        Returns None when `revision` is unknown (too old, or from another
+        server run): the caller should then send the full snapshot.
+        """
+        snapshot = self.snapshot()
+        if revision in self._diffs:
+            return self._diffs[revision]
+
+        old = snapshot if revision == snapshot.revision else None
+        if old is None:
+            old = next((s for s in self._history if s.revision == revision), None)
+        if old is None:
+            return None
+
+        changed = [row for code, row in snapshot.rows.items() if old.rows.get(code) != row]
+        removed = [code for code in old.rows if code not in snapshot.rows]
+        body = json.dumps({
+            "revision": snapshot.revision,
+            "since": revision,
+            "changed": changed,
+            "removed": removed,
+        }).encode("utf-8")
+        self._diffs[revision] = body
+        return body
+
+
+class ScoreboardServer:
+    """Minimal asyncio HTTP/1.1 server exposing the scoreboard.
+
+    Routes:
+        GET /                          HTML scoreboard (follows /events)
+        GET /api/rankings              JSON rankings, honours If-None-Match
+        GET /api/rankings?since=REV    long-poll: waits for a change, then
+                                       returns the diff since REV
+        GET /events                    Server-Sent Events change feed
+    """
+
+    def __init__(self, host="127.0.0.1", port=8765, poll_timeout=25.0, coalesce=0.2):
+        self.host = host
+        self.port = port
+        self.poll_timeout = poll_timeout
+        self.coalesce = coalesce
+        self.scoreboard = Scoreboard()
+        self._token = secrets.token_hex(4)  # Keeps ETags from older runs from matching
+        self._loop = None
+        self._server = None
+        self._changed = None
+        self._thread = None
+
+    @property
+    def url(self):
+        return f"http://{self.host}:{self.port}/"
+
+    # --- Lifecycle ---
+
+    async def open(self):
+        """Start listening on the running event loop."""
+        self._loop = asyncio.get_running_loop()
+        self._changed = asyncio.Event()
+        self._server = await asyncio.start_server(self._handle, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+        add_listener(self._on_session_change)
+
+    async def close(self):
+        remove_listener(self._on_session_change)
+        self._server.close()
+        self._changed.set()  # Release waiting clients
+        await self._server.wait_closed()
+
+    async def serve_forever(self):
+        await self.open()
+        try:
+            await self._server.serve_forever()
+        finally:
+            await self.close()
+
+    def start(self):
+        """Run the server on a background thread (used by the GUI)."""
+        ready = threading.Event()
+        errors = []
+
+        def run():
+            loop = asyncio.new_event_loop()
+            asyncio.set_event_loop(loop)
+            try:
+                loop.run_until_complete(self.open())
+            except OSError as e:
+                errors.append(e)
+                ready.set()
+                loop.close()
+                return
+            ready.set()
+            loop.run_forever()
+            loop.run_until_complete(self.close())
+            # Drop idle keep-alive connections still waiting for a request
+            pending = asyncio.all_tasks(loop)
+            for task in pending:
+                task.cancel()
+            loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
+            loop.close()
+
+        self._thread = threading.Thread(target=run, name="scoreboard", daemon=True)
+        self._thread.start()
+        ready.wait()
+        if errors:
+            self._thread = None
+            raise errors[0]
+
+    def stop(self):
+        if self._thread is None:
+            return
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._thread = None
+
+    def is_running(self):
+        return self._thread is not None
+
+    def _on_session_change(self, revision):
+        # Called on the thread that changed the session
+        self._loop.call_soon_threadsafe(self._wake)
+
+    def _wake(self):
+        # Wake every waiter at once, then arm a fresh event for the next change
+        changed, self._changed = self._changed, asyncio.Event()
+        changed.set()
+
+    async def _wait_for_change(self, revision, timeout):
+        """Wait until the session moves past `revision`; False on timeout."""
+        if current_revision() != revision:
+            return True
+        try:
+            await asyncio.wait_for(self._changed.wait(), timeout)
+        except asyncio.TimeoutError:
+            return False
+        # Let rapid-fire entries settle into one update
+        await asyncio.sleep(self.coalesce)
+        return True
+
+    # --- HTTP ---
+
+    async def _handle(self, reader, writer):
+        try:
+            while True:
+                try:
+                    request = await _read_request(reader)
+                except ValueError:
+                    # Malformed or oversized request: answer and drop the connection
+                    await _send(writer, HTTPStatus.BAD_REQUEST, keep_alive=False)
+                    break
+                if request is None:
+                    break
+                method, target, headers = request
+                keep_alive = headers.get("connection", "").lower() != "close"
+                path, _, query = target.partition("?")
+                params = parse_qs(query)
+
+                if method not in ("GET", "HEAD"):
+                    await _send(writer, HTTPStatus.METHOD_NOT_ALLOWED, keep_alive=keep_alive)
+                elif path == "/":
+                    await _send(writer, HTTPStatus.OK, PAGE, "text/html; charset=utf-8",
+                                keep_alive=keep_alive, head=method == "HEAD")
+                elif path == "/api/rankings":
+                    await self._rankings(writer, headers, params, keep_alive, method == "HEAD")
+                elif path == "/events":
+                    await self._events(writer, headers)
+                    break
+                else:
+                    await _send(writer, HTTPStatus.NOT_FOUND, keep_alive=keep_alive)
+
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass  # Client went away; anything else is reported by asyncio
+        except asyncio.CancelledError:
+            pass  # Server stopping: stop() cancels idle keep-alive and waiting clients
+        finally:
+            writer.close()
+
+    def _etag(self, revision):
+        return f'"{self._token}-{revision}"'
+
+    async def _rankings(self, writer, headers, params, keep_alive, head):
+        since = params.get("since", [None])[0]
+        if since is not None:
+            try:
+                since = int(since)
+            except ValueError:
+                await _send(writer, HTTPStatus.BAD_REQUEST, keep_alive=keep_alive)
+                return
+            await self._wait_for_change(since, self.poll_timeout)
+
+        snapshot = self.scoreboard.snapshot()
+        etag = self._etag(snapshot.revision)
+        extra = {"ETag": etag, "Cache-Control": "no-cache"}
+
+        if since is None and headers.get("if-none-match") == etag:
+            await _send(writer, HTTPStatus.NOT_MODIFIED, headers=extra, keep_alive=keep_alive)
+            return
+        if since == snapshot.revision:
+            # Long-poll timed out without changes
+            await _send(writer, HTTPStatus.NOT_MODIFIED, headers=extra, keep_alive=keep_alive)
+            return
+
+        body = snapshot.body
+        if since is not None:
+            body = self.scoreboard.changes_since(since) or snapshot.body
+        await _send(writer, HTTPStatus.OK, body, "application/json",
+                    headers=extra, keep_alive=keep_alive, head=head)
+
+    async def _events(self, writer, headers):
+        writer.write(
+            b"HTTP/1.1 200 OK\r\n"
+            b"Content-Type: text/event-stream\r\n"
+            b"Cache-Control: no-cache\r\n"
+            b"Connection: keep-alive\r\n\r\n"
+        )
+
+        revision = None
+        last_event_id = headers.get("last-event-id")
+        if last_event_id and last_event_id.isdigit():
+            revision = int(last_event_id)
+
+        while True:
+            snapshot = self.scoreboard.snapshot()
+            if revision != snapshot.revision:
+                body = self.scoreboard.changes_since(revision) if revision is not None else None
+                event = b"changes" if body is not None else b"snapshot"
+                body = body or snapshot.body
+                revision = snapshot.revision
+                writer.write(b"id: %d\nevent: %s\ndata: %s\n\n" % (revision, event, body))
+            await writer.drain()
+
+            if not await self._wait_for_change(revision, 15.0):
+                writer.write(b": ping\n\n")  # Keeps proxies from dropping the stream
+            if not self._server.is_serving():
+                return
+
+
+########################
+# FUNCTIONS            #
+########################
+
+def build_rankings():
+    """Rank every delegate of the session by score (highest first)."""
+    rows = {}
+    for rank, (delegate, score) in enumerate(ranking(), start=1):
+        rows[delegate.code] = {
+            "rank": rank,
+            "code": delegate.code,
+            "name": f"{delegate.surname} {delegate.name}",
+            "committee": delegate.committee_name,
+            "school": delegate.school_name,
+            "speeches": delegate.speech_count(),
+            "score": round(score, 2),
+        }
+    return rows
+
+
+async def _read_request(reader):
+    """Return (method, target, headers), or None at end of stream.
+
+    Raises ValueError on a malformed request or a line over the stream limit.
+    """
+    line = await reader.readline()
+    if not line:
+        return None
+    parts = line.decode("latin-1").split()
+    if len(parts) != 3:
+        raise ValueError("Malformed request line")
+    method, target, _ = parts
+
+    headers = {}
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b"\n", b""):
+            break
+        if len(headers) > 100:
+            raise ValueError("Too many headers")
+        name, _, value = line.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip()
+    return method, target, headers
+
+
+async def _send(writer, status, body=b"", content_type=None, headers=None, keep_alive=True, head=False):
+    lines = [f"HTTP/1.1 {status.value} {status.phrase}"]
+    if content_type:
+        lines.append(f"Content-Type: {content_type}")
+    for name, value in (headers or {}).items():
+        lines.append(f"{name}: {value}")
+    if status == HTTPStatus.NOT_MODIFIED:
+        body = b""
+    lines.append(f"Content-Length: {len(body)}")
+    lines.append("Connection: keep-alive" if keep_alive else "Connection: close")
+    writer.write(("\r\n".join(lines) + "\r\n\r\n").encode("latin-1"))
+    if not head:
+        writer.write(body)
+    await writer.drain()
+
+
+PAGE = b"""<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<meta name="viewport" content="width=device-width, initial-scale=1">
+<title>MEPGest Scoreboard</title>
+<style>
+  body { font-family: Arial, sans-serif; margin: 0; padding: 12px; background: #2E3440; color: #E5E9F0; }
+  h1 { font-size: 1.4em; text-align: center; }
+  input { width: 100%; box-sizing: border-box; padding: 8px; margin-bottom: 8px; }
+  table { width: 100%; border-collapse: collapse; }
+  th, td { padding: 6px 4px; text-align: left; border-bottom: 1px solid #4C566A; }
+  td.num { text-align: right; }
+  #status { font-size: 0.8em; color: #88C0D0; text-align: center; }
+</style>
+</head>
+<body>
+<h1>MEPGest Scoreboard</h1>
+<input id="filter" placeholder="Filter by name, school or committee">
+<div id="status">Connecting...</div>
+<table>
+  <thead><tr><th>#</th><th>Code</th><th>Name</th><th>School</th><th>Speeches</th><th>Score</th></tr></thead>
+  <tbody id="rows"></tbody>
+</table>
+<script>
+const rows = new Map();
+const tbody = document.getElementById("rows");
+const filter = document.getElementById("filter");
+const status = document.getElementById("status");
+
+function cell(text, cls) {
+  const td = document.createElement("td");
+  td.textContent = text;
+  if (cls) td.className = cls;
+  return td;
+}
+
+function render() {
+  const needle = filter.value.toLowerCase();
+  const sorted = [...rows.values()].sort((a, b) => a.rank - b.rank);
+  const fragment = document.createDocumentFragment();
+  for (const r of sorted) {
+    if (needle && !(r.name + " " + r.school + " " + r.committee).toLowerCase().includes(needle)) continue;
+    const tr = document.createElement("tr");
+    tr.append(cell(r.rank), cell(r.code), cell(r.name), cell(r.school),
+              cell(r.speeches, "num"), cell(r.score.toFixed(2), "num"));
+    fragment.append(tr);
+  }
+  tbody.replaceChildren(fragment);
+}
+
+const events = new EventSource("/events");
+events.addEventListener("snapshot", (e) => {
+  const data = JSON.parse(e.data);
+  rows.clear();
+  for (const r of data.rankings) rows.set(r.code, r);
+  status.textContent = "Live (revision " + data.revision + ")";
+  render();
+});
+events.addEventListener("changes", (e) => {
+  const data = JSON.parse(e.data);
+  for (const code of data.removed) rows.delete(code);
+  for (const r of data.changed) rows.set(r.code, r);
+  status.textContent = "Live (revision " + data.revision + ")";
+  render();
+});
+events.onerror = () => { status.textContent = "Reconnecting..."; };
+filter.addEventListener("input", render);
+</script>
+</body>
+</html>
+"""
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve a read-only scoreboard for a roster file.")
+    parser.add_argument("roster", help="Excel file with the delegates")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+
+    from mepgest.loaders import load_delegates
+    if not load_delegates(args.roster):
+        raise SystemExit(1)
+
+    server = ScoreboardServer(args.host, args.port)
+    print(f"🌐 Scoreboard on http://{args.host}:{args.port}/")
+    try:
+        asyncio.run(server.serve_forever())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
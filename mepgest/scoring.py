@@ -0,0 +1,369 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# File: scoring.py
+# Created: 19-10-2026
+# Author: Lorenzo Calandra Buonaura <lorenzocb01@gmail.com>
+# Institution: APS Model European Parliament Italia
+#
+# Description: Pluggable scoring policies. The session is kept as numpy
+#              arrays (one entry per delegate and per speech), updated one
+#              speech at a time; a policy is a formula over those arrays, so
+#              re-ranking under another policy never loops over delegates.
+#
+
+
+########################
+# IMPORT ZONE          #
+########################
+
+from time import monotonic
+
+import numpy as np
+
+from mepgest.models import (
+    committees, speech_log, session_lock, data_revision, touch, add_speech_observer,
+)
+from mepgest.speech import SpeechType
+
+
+########################
+# CLASSES              #
+########################
+
+SPEECH_TYPES = list(SpeechType)
+TYPE_INDEX = {speech_type: i for i, speech_type in enumerate(SPEECH_TYPES)}
+
+
+class SessionArrays:
+    """Column view of the session used by the scoring policies.
+
+    Delegates are indexed 0..n-1; `committee` and `school` hold the group
+    index of each delegate. Speech columns share the speech index:
+    `speech_delegate`, `speech_type` (index into SPEECH_TYPES),
+    `speech_weight` (weight recorded when the speech was given) and
+    `speech_time` (monotonic timestamp).
+    """
+
+    def __init__(self, committee, school, speech_delegate, speech_type, speech_weight, speech_time,
+                 delegates=None, committee_names=None, school_names=None, index=None):
+        self.committee = np.asarray(committee, dtype=np.intp)
+        self.school = np.asarray(school, dtype=np.intp)
+        self.speech_delegate = np.asarray(speech_delegate, dtype=np.intp)
+        self.speech_type = np.asarray(speech_type, dtype=np.intp)
+        self.speech_weight = np.asarray(speech_weight, dtype=float)
+        self.speech_time = np.asarray(speech_time, dtype=float)
+        self.delegates = delegates or []
+        self.committee_names = committee_names or []
+        self.school_names = school_names or []
+        self.n_committees = int(self.committee.max()) + 1 if len(self.committee) else 0
+        self.n_schools = int(self.school.max()) + 1 if len(self.school) else 0
+        if index is None:
+            index = {delegate._serial: i for i, delegate in enumerate(self.delegates)}
+        self.index = index
+
+    def __len__(self):
+        return len(self.committee)
+
+    @classmethod
+    def from_session(cls):
+        # One consistent snapshot: the GUI may be adding speeches meanwhile
+        with session_lock:
+            delegates = [delegate for committee in committees.values() for delegate in committee.delegates]
+            speeches = [(speech["delegate"]._serial, speech["type"], speech["weight"], speech["time"])
+                        for speech in speech_log]
+
+        committee_ids, school_ids = {}, {}
+        committee = [committee_ids.setdefault(d.committee_name, len(committee_ids)) for d in delegates]
+        school = [school_ids.setdefault(d.school_name, len(school_ids)) for d in delegates]
+        position = {delegate._serial: i for i, delegate in enumerate(delegates)}
+        serials, types, weights, times = zip(*speeches) if speeches else ((), (), (), ())
+        return cls(
+            committee, school,
+            [position[serial] for serial in serials],
+            [TYPE_INDEX[speech_type] for speech_type in types],
+            weights, times,
+            delegates, list(committee_ids), list(school_ids),
+        )
+
+    def delegate_sum(self, values):
+        """Sum a per-speech column into a per-delegate column."""
+        return np.bincount(self.speech_delegate, weights=values, minlength=len(self))
+
+    def group_mean(self, values, group):
+        """Per-delegate column holding the mean of `values` over each delegate's
+        committee (group="committee") or school (group="school")."""
+        idx = self.committee if group == "committee" else self.school
+        size = self.n_committees if group == "committee" else self.n_schools
+        totals = np.bincount(idx, weights=values, minlength=size)
+        counts = np.bincount(idx, minlength=size)
+        means = np.divide(totals, counts, out=np.zeros(size), where=counts > 0)
+        return means[idx]
+
+
+class SpeechColumns:
+    """Speech columns of the live session, updated with every speech.
+
+    Registered as a speech observer of the models: recording or undoing a
+    speech shifts one entry of each column instead of rebuilding them from
+    the speech log. Delegate columns are only rebuilt when the roster grows.
+    """
+
+    FIELDS = (("id", np.int64), ("delegate", np.intp), ("type", np.intp), ("weight", float), ("time", float))
+
+    def __init__(self):
+        self.roster = None  # SessionArrays of the last full rebuild; None = stale
+        self.size = 0
+        self.columns = {}
+
+    def rebuild(self):
+        # Caller holds session_lock
+        self.roster = SessionArrays.from_session()
+        self.size = len(speech_log)
+        capacity = max(2 * self.size, 1024)
+        self.columns = {name: np.empty(capacity, dtype=dtype) for name, dtype in self.FIELDS}
+        self.columns["id"][:self.size] = [speech["id"] for speech in speech_log]
+        self.columns["delegate"][:self.size] = self.roster.speech_delegate
+        self.columns["type"][:self.size] = self.roster.speech_type
+        self.columns["weight"][:self.size] = self.roster.speech_weight
+        self.columns["time"][:self.size] = self.roster.speech_time
+
+    def add(self, speech):
+        if self.roster is None:
+            return
+        delegate = self.roster.index.get(speech["delegate"]._serial)
+        if delegate is None:
+            self.roster = None  # Speaker joined after the last rebuild
+            return
+        if self.size == len(self.columns["id"]):
+            for name, column in self.columns.items():
+                self.columns[name] = np.resize(column, 2 * len(column))
+
+        n = self.size
+        at = int(np.searchsorted(self.columns["id"][:n], speech["id"]))  # n in practice: ids only grow
+        values = (speech["id"], delegate, TYPE_INDEX[speech["type"]], speech["weight"], speech["time"])
+        for (name, _), value in zip(self.FIELDS, values):
+            column = self.columns[name]
+            column[at + 1:n + 1] = column[at:n]
+            column[at] = value
+        self.size += 1
+
+    def remove(self, speech):
+        if self.roster is None:
+            return
+        n = self.size
+        at = int(np.searchsorted(self.columns["id"][:n], speech["id"]))
+        if at == n or self.columns["id"][at] != speech["id"]:
+            self.roster = None  # Out of step: rebuild on the next read
+            return
+        for column in self.columns.values():
+            column[at:n - 1] = column[at + 1:n]
+        self.size -= 1
+
+    def arrays(self):
+        """SessionArrays of the session as it is now (caller holds session_lock)."""
+        roster_size = sum(len(committee.delegates) for committee in committees.values())
+        if self.roster is None or len(self.roster) != roster_size:
+            self.rebuild()
+            return self.roster
+
+        n, roster = self.size, self.roster
+        # Copies: the returned arrays must not move with later speeches
+        return SessionArrays(
+            roster.committee, roster.school,
+            self.columns["delegate"][:n].copy(), self.columns["type"][:n].copy(),
+            self.columns["weight"][:n].copy(), self.columns["time"][:n].copy(),
+            roster.delegates, roster.committee_names, roster.school_names, index=roster.index,
+        )
+
+
+class ScoringPolicy:
+    """A scoring formula evaluated over the whole session at once.
+
+    `weights` optionally overrides the speech weights with a profile
+    {SpeechType or label: weight}; otherwise the weight recorded with each
+    speech is used. Policies whose scores change with the clock set
+    `time_dependent`, so their scores are never cached.
+    """
+
+    name = "Custom"
+    time_dependent = False
+
+    def __init__(self, weights=None):
+        self.weights = None
+        if weights is not None:
+            self.weights = np.array([
+                weights.get(t, weights.get(t.value, SpeechType.get_weight(t))) for t in SPEECH_TYPES
+            ], dtype=float)
+
+    def speech_weights(self, arrays):
+        if self.weights is None:
+            return arrays.speech_weight
+        return self.weights[arrays.speech_type]
+
+    def evaluate(self, arrays):
+        """Return one score per delegate of `arrays`."""
+        raise NotImplementedError
+
+
+class DefaultPolicy(ScoringPolicy):
+    """Delegate weight + committee mean weight + school mean weight."""
+
+    name = "Default"
+
+    def delegate_weights(self, arrays):
+        return arrays.delegate_sum(self.speech_weights(arrays))
+
+    def evaluate(self, arrays):
+        w = self.delegate_weights(arrays)
+        return w + arrays.group_mean(w, "committee") + arrays.group_mean(w, "school")
+
+
+class CappedPolicy(DefaultPolicy):
+    """Default formula counting at most `caps[type]` speeches of each type per delegate.
+
+    The earliest speeches count; types missing from `caps` are unlimited.
+    """
+
+    name = "Capped"
+
+    def __init__(self, caps, weights=None):
+        super().__init__(weights)
+        self.caps = np.array([caps.get(t, caps.get(t.value, np.inf)) for t in SPEECH_TYPES], dtype=float)
+
+    def speech_weights(self, arrays):
+        weights = super().speech_weights(arrays)
+        n = len(weights)
+        if n == 0:
+            return weights
+
+        # Rank of each speech among the same delegate's speeches of the same type
+        order = np.lexsort((arrays.speech_time, arrays.speech_type, arrays.speech_delegate))
+        delegate = arrays.speech_delegate[order]
+        kind = arrays.speech_type[order]
+        starts = np.ones(n, dtype=bool)
+        starts[1:] = (delegate[1:] != delegate[:-1]) | (kind[1:] != kind[:-1])
+        first = np.flatnonzero(starts)
+        rank = np.arange(n) - first[np.cumsum(starts) - 1]
+
+        keep = np.empty(n, dtype=bool)
+        keep[order] = rank < self.caps[kind]
+        return weights * keep
+
+
+class DecayPolicy(DefaultPolicy):
+    """Default formula where a speech's weight halves every `half_life` minutes."""
+
+    name = "Decay"
+    time_dependent = True  # Scores fade between revisions
+
+    def __init__(self, half_life=60, weights=None):
+        super().__init__(weights)
+        self.half_life = half_life
+
+    def speech_weights(self, arrays):
+        age = (monotonic() - arrays.speech_time) / 60
+        return super().speech_weights(arrays) * np.exp2(-np.maximum(age, 0) / self.half_life)
+
+
+class SharePolicy(ScoringPolicy):
+    """Delegate weight as a share of the committee and school averages.
+
+    1.0 on each term means "spoke as much as the average member"; delegates
+    of quiet committees are no longer ranked below those of busy ones.
+    """
+
+    name = "Normalized share"
+
+    def evaluate(self, arrays):
+        w = arrays.delegate_sum(self.speech_weights(arrays))
+        share = np.zeros(len(w))
+        for group in ("committee", "school"):
+            mean = arrays.group_mean(w, group)
+            share += np.divide(w, mean, out=np.zeros(len(w)), where=mean > 0)
+        return share
+
+
+class FormulaPolicy(ScoringPolicy):
+    """Policy from a function formula(arrays, speech_weights) -> scores."""
+
+    def __init__(self, formula, name="Custom", weights=None):
+        super().__init__(weights)
+        self.formula = formula
+        self.name = name
+
+    def evaluate(self, arrays):
+        return np.asarray(self.formula(arrays, self.speech_weights(arrays)), dtype=float)
+
+
+POLICIES = {
+    policy.name: policy for policy in (
+        DefaultPolicy(),
+        CappedPolicy({SpeechType.FOLLOW_UP: 3, SpeechType.INTERVENTION: 3}),
+        DecayPolicy(half_life=60),
+        SharePolicy(),
+    )
+}
+
+
+########################
+# FUNCTIONS            #
+########################
+
+_active = POLICIES["Default"]
+_cache = {"revision": None, "arrays": None, "scores": {}}
+_lock = session_lock  # The scoreboard ranks from its own thread
+_columns = SpeechColumns()
+add_speech_observer(_columns)
+
+
+def get_policy():
+    return _active
+
+
+def set_policy(policy):
+    """Make `policy` (an instance or a name from POLICIES) the session policy."""
+    global _active
+    with _lock:
+        _active = POLICIES[policy] if isinstance(policy, str) else policy
+        touch(data=False)  # Rankings everywhere are now stale, the arrays are not
+
+
+def session_arrays():
+    """Arrays of the live session, taken at most once per data revision."""
+    with _lock:
+        revision = data_revision()
+        if _cache["revision"] != revision:
+            _cache["arrays"] = _columns.arrays()
+            _cache["scores"] = {}
+            _cache["revision"] = revision
+        return _cache["arrays"]
+
+
+def scores(policy=None):
+    """Score of every delegate of session_arrays() under `policy` (default: active).
+
+    Returns (arrays, scores) so both come from the same revision.
+    """
+    policy = policy or _active
+    with _lock:
+        arrays = session_arrays()
+        if policy.time_dependent:
+            return arrays, policy.evaluate(arrays)
+        key = id(policy)
+        if key not in _cache["scores"]:
+            _cache["scores"][key] = (policy, policy.evaluate(arrays))
+        return arrays, _cache["scores"][key][1]
+
+
+def score_of(delegate, policy=None):
+    arrays, values = scores(policy)
+    i = arrays.index.get(delegate._serial)
+    return float(values[i]) if i is not None else 0.0
+
+
+def ranking(policy=None):
+    """[(delegate, score)] of the whole session, highest score first."""
+    arrays, values = scores(policy)
+    order = np.argsort(-values, kind="stable")
+    return [(arrays.delegates[i], float(values[i])) for i in order]
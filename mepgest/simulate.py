@@ -0,0 +1,218 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# File: simulate.py
+# Created: 19-10-2026
+# Author: Lorenzo Calandra Buonaura <lorenzocb01@gmail.com>
+# Institution: APS Model European Parliament Italia
+#
+# Description: Monte Carlo simulator for the speech weights. Synthetic
+#              debates are generated over a roster and scored under
+#              candidate weight profiles with the vectorized scoring path;
+#              fairness metrics are averaged over many sessions spread on
+#              a process pool. Runs are reproducible for a given seed,
+#              whatever the number of workers.
+#
+# Usage: python -m mepgest.simulate data/delegates.xlsx --sessions 20000 --seed 1
+#
+
+
+########################
+# IMPORT ZONE          #
+########################
+
+import argparse
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from mepgest.scoring import SPEECH_TYPES, DefaultPolicy, SessionArrays, session_arrays
+from mepgest.speech import SpeechType
+
+
+########################
+# CLASSES              #
+########################
+
+METRICS = ("score_gini", "school_spread", "committee_spread")
+
+# Share of each speech type in a typical debate, in SPEECH_TYPES order
+DEFAULT_TYPE_MIX = {
+    SpeechType.OPENING: 0.08,
+    SpeechType.AMENDMENT_SPEECH: 0.10,
+    SpeechType.AMENDMENT_DEFENSE: 0.08,
+    SpeechType.FOLLOW_UP: 0.25,
+    SpeechType.FOLLOW_UP_DEFENSE: 0.15,
+    SpeechType.INTERVENTION: 0.14,
+    SpeechType.DEFENSE: 0.08,
+    SpeechType.SPEECH_AGAINST: 0.08,
+    SpeechType.CLOSING: 0.04,
+}
+
+
+class DebateModel:
+    """How synthetic debates are drawn.
+
+    Each committee gets Poisson(`speeches_per_committee`) speeches; each
+    delegate has a log-normal propensity to speak (`activity_sigma` = 0
+    means everyone is equally likely to get the floor), redrawn for every
+    session; speech types follow `type_mix`.
+    """
+
+    def __init__(self, speeches_per_committee=40, activity_sigma=0.6, type_mix=None):
+        self.speeches_per_committee = speeches_per_committee
+        self.activity_sigma = activity_sigma
+        mix = type_mix or DEFAULT_TYPE_MIX
+        p = np.array([mix.get(t, mix.get(t.value, 0)) for t in SPEECH_TYPES], dtype=float)
+        self.type_p = p / p.sum()
+
+    def draw(self, rng, committee, school, order, starts):
+        """Return a SessionArrays with one synthetic debate over the roster."""
+        n_committees = len(starts) - 1
+        counts = rng.poisson(self.speeches_per_committee, n_committees)
+        speech_committee = np.repeat(np.arange(n_committees), counts)
+
+        # Pick the speaker of each speech inside its committee, proportionally to activity
+        activity = rng.lognormal(0.0, self.activity_sigma, len(order)) if self.activity_sigma else np.ones(len(order))
+        cumulative = np.concatenate(([0.0], np.cumsum(activity)))
+        low = cumulative[starts[speech_committee]]
+        high = cumulative[starts[speech_committee + 1]]
+        target = low + rng.random(len(speech_committee)) * (high - low)
+        position = np.searchsorted(cumulative, target, side="right") - 1
+        position = np.clip(position, starts[speech_committee], starts[speech_committee + 1] - 1)
+
+        speech_type = rng.choice(len(SPEECH_TYPES), size=len(speech_committee), p=self.type_p)
+        zeros = np.zeros(len(speech_committee))
+        return SessionArrays(committee, school, order[position], speech_type, zeros, zeros)
+
+
+########################
+# FUNCTIONS            #
+########################
+
+def gini(values):
+    """Gini coefficient of a non-negative array (0 = perfectly even)."""
+    total = values.sum()
+    n = len(values)
+    if n == 0 or total <= 0:
+        return 0.0
+    ranked = np.sort(values)
+    return float(2 * np.dot(np.arange(1, n + 1), ranked) / (n * total) - (n + 1) / n)
+
+
+def group_spread(weights, index, size):
+    """Coefficient of variation of the mean weight per delegate across groups."""
+    counts = np.bincount(index, minlength=size)
+    means = np.bincount(index, weights=weights, minlength=size)[counts > 0] / counts[counts > 0]
+    mean = means.mean() if len(means) else 0
+    return float(means.std() / mean) if mean > 0 else 0.0
+
+
+def fairness(policy, arrays):
+    """Fairness metrics of one session under one policy."""
+    weights = arrays.delegate_sum(policy.speech_weights(arrays))
+    scores = policy.evaluate(arrays)
+    return (
+        gini(np.maximum(scores, 0)),
+        group_spread(weights, arrays.school, arrays.n_schools),
+        group_spread(weights, arrays.committee, arrays.n_committees),
+    )
+
+
+def _run_chunk(task):
+    """Simulate a chunk of sessions; returns per-policy sums and sums of squares."""
+    committee, school, policies, model, n_sessions, seed = task
+    rng = np.random.default_rng(seed)
+
+    order = np.argsort(committee, kind="stable")
+    n_committees = int(committee.max()) + 1
+    starts = np.searchsorted(committee[order], np.arange(n_committees + 1))
+
+    totals = np.zeros((len(policies), len(METRICS)))
+    squares = np.zeros_like(totals)
+    for _ in range(n_sessions):
+        arrays = model.draw(rng, committee, school, order, starts)
+        for i, policy in enumerate(policies):
+            metrics = np.array(fairness(policy, arrays))
+            totals[i] += metrics
+            squares[i] += metrics ** 2
+    return totals, squares
+
+
+def simulate(profiles, sessions=10_000, seed=0, workers=None, model=None, arrays=None, chunk_size=250):
+    """Compare weight profiles over `sessions` synthetic debates.
+
+    `profiles` maps a profile name to {SpeechType or label: weight}; the
+    roster is taken from `arrays` (default: the live session). Sessions are
+    split into fixed chunks seeded from `seed`, so results do not depend on
+    `workers`. Returns {profile: {metric: (mean, std)}}.
+    """
+    if arrays is None:
+        arrays = session_arrays()
+    if len(arrays) == 0:
+        raise ValueError("No delegates loaded: nothing to simulate")
+    model = model or DebateModel()
+    names = list(profiles)
+    policies = [DefaultPolicy(weights=profiles[name]) for name in names]
+
+    chunks = [chunk_size] * (sessions // chunk_size)
+    if sessions % chunk_size:
+        chunks.append(sessions % chunk_size)
+    seeds = np.random.SeedSequence(seed).spawn(len(chunks))
+    tasks = [(arrays.committee, arrays.school, policies, model, n, s) for n, s in zip(chunks, seeds)]
+
+    workers = workers or os.cpu_count() or 1
+    if workers <= 1 or len(tasks) == 1:
+        results = list(map(_run_chunk, tasks))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(_run_chunk, tasks))
+
+    totals = sum(result[0] for result in results)
+    squares = sum(result[1] for result in results)
+    means = totals / sessions
+    stds = np.sqrt(np.maximum(squares / sessions - means ** 2, 0))
+    return {
+        name: {metric: (float(means[i, j]), float(stds[i, j])) for j, metric in enumerate(METRICS)}
+        for i, name in enumerate(names)
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare speech weight profiles on synthetic debates.")
+    parser.add_argument("roster", help="Excel file with the delegates")
+    parser.add_argument("--profiles", help="JSON file {profile: {speech label: weight}} "
+                                           "(default: current weights vs. all equal)")
+    parser.add_argument("--sessions", type=int, default=10_000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--speeches", type=float, default=40, help="Mean speeches per committee")
+    parser.add_argument("--activity-sigma", type=float, default=0.6)
+    args = parser.parse_args()
+
+    from mepgest.loaders import load_delegates
+    if not load_delegates(args.roster):
+        raise SystemExit(1)
+
+    if args.profiles:
+        with open(args.profiles, encoding="utf-8") as f:
+            profiles = json.load(f)
+    else:
+        profiles = {
+            "Current": dict(SpeechType._weights),
+            "Equal": {t.value: 1 for t in SpeechType},
+        }
+
+    model = DebateModel(args.speeches, args.activity_sigma)
+    print(f"\n🎲 Simulating {args.sessions} sessions (seed {args.seed})...\n")
+    results = simulate(profiles, args.sessions, args.seed, args.workers, model)
+
+    print(f"{'Profile':<20}" + "".join(f"{metric:>22}" for metric in METRICS))
+    for name, metrics in results.items():
+        print(f"{name:<20}" + "".join(f"{mean:>13.4f} ± {std:<6.4f}" for mean, std in metrics.values()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# File: style.py
+# Created: 19-10-2026
+# Author: Lorenzo Calandra Buonaura <lorenzocb01@gmail.com>
+# Institution: APS Model European Parliament Italia
+#
+# Description: Shared look of the GUI. The application stylesheet and the
+#              palette of each theme are generated once and cached; fonts
+#              and widget-specific styles live in that one sheet behind
+#              object-name selectors instead of per-widget fonts and sheets.
+#
+
+
+########################
+# IMPORT ZONE          #
+########################
+
+from functools import cache
+
+import qdarktheme
+
+
+########################
+# CLASSES              #
+########################
+
+THEMES = ("dark", "light")
+
+# Appended to the qdarktheme sheet; widgets opt in with setObjectName().
+# Qt ignores setFont() defaults once a stylesheet is set, so fonts live here too.
+APP_STYLE = """
+QTabWidget QLabel {
+    font: 12pt "Arial";
+}
+QLabel#columnHeader {
+    font: bold 12pt "Arial";
+}
+QLabel#hintLabel {
+    font: italic 10pt "Arial";
+}
+QLabel#warningLabel {
+    font: 11pt "Arial";
+    color: red;
+}
+QLabel#committeeTitle {
+    font: bold 18pt "Arial";
+    border: 2px solid #5E81AC;
+    border-radius: 8px;
+    padding: 10px;
+    margin-bottom: 10px;
+}
+QLabel#appTitle {
+    font: bold 28pt "Arial";
+    color: #E5E9F0;
+}
+"""
+
+
+########################
+# FUNCTIONS            #
+########################
+
+_theme = {"current": None}
+
+
+@cache
+def stylesheet(theme="dark"):
+    return qdarktheme.load_stylesheet(theme) + APP_STYLE
+
+
+@cache
+def palette(theme="dark"):
+    return qdarktheme.load_palette(theme)
+
+
+def current_theme():
+    return _theme["current"]
+
+
+def apply_theme(app, theme="dark"):
+    """Give `app` the palette and stylesheet of `theme` ("dark" or "light")."""
+    if theme not in THEMES:
+        raise ValueError(f"theme must be one of {THEMES}")
+    if theme == _theme["current"]:
+        return
+    app.setPalette(palette(theme))
+    app.setStyleSheet(stylesheet(theme))
+    _theme["current"] = theme
+
+
+def toggle_theme(app):
+    """Switch `app` to the other theme and return its name."""
+    theme = "light" if _theme["current"] == "dark" else "dark"
+    apply_theme(app, theme)
+    return theme
+
+
+def preload():
+    """Build every theme's resources now, so the first toggle does not pay for it."""
+    for theme in THEMES:
+        stylesheet(theme)
+        palette(theme)
@@ -0,0 +1,121 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# File: timeline.py
+# Created: 19-10-2026
+# Author: Lorenzo Calandra Buonaura <lorenzocb01@gmail.com>
+# Institution: APS Model European Parliament Italia
+#
+# Description: Time-windowed speech analytics. Speech timestamps are kept
+#              in sorted arrays per committee and per school, so a window
+#              query is two binary searches instead of a scan.
+#
+
+
+########################
+# IMPORT ZONE          #
+########################
+
+from bisect import bisect_left, bisect_right, insort
+from time import monotonic, time as wall_clock
+
+
+########################
+# CLASSES              #
+########################
+
+# Speech times are monotonic; this pair maps them back to wall-clock time
+SESSION_START = monotonic()
+SESSION_START_WALL = wall_clock()
+
+KINDS = ("committee", "school")
+
+
+class SpeechTimeline:
+    """Sorted speech timestamps, grouped by committee and by school."""
+
+    def __init__(self):
+        self._times = {kind: {} for kind in KINDS}
+        self._all = []
+
+    def _keys(self, speech):
+        delegate = speech["delegate"]
+        return (("committee", delegate.committee_name), ("school", delegate.school_name))
+
+    def add(self, speech):
+        t = speech["time"]
+        insort(self._all, t)  # Appends in practice: new speeches are the latest
+        for kind, name in self._keys(speech):
+            insort(self._times[kind].setdefault(name, []), t)
+
+    def remove(self, speech):
+        t = speech["time"]
+        _discard(self._all, t)
+        for kind, name in self._keys(speech):
+            _discard(self._times[kind].get(name, []), t)
+
+    def clear(self):
+        self._times = {kind: {} for kind in KINDS}
+        self._all = []
+
+    def names(self, kind):
+        return list(self._times[kind])
+
+    def times(self, kind=None, name=None):
+        """Sorted timestamps of a group, or of the whole session."""
+        if kind is None:
+            return self._all
+        return self._times[kind].get(name, [])
+
+    def count(self, kind=None, name=None, start=None, end=None):
+        """Number of speeches with start <= time < end."""
+        times = self.times(kind, name)
+        lo = 0 if start is None else bisect_left(times, start)
+        hi = len(times) if end is None else bisect_left(times, end)
+        return max(hi - lo, 0)
+
+    def window_counts(self, kind, minutes, now=None):
+        """Speeches per committee/school in the last `minutes` minutes."""
+        now = monotonic() if now is None else now
+        start = now - minutes * 60
+        return {
+            name: bisect_right(times, now) - bisect_left(times, start)
+            for name, times in self._times[kind].items()
+        }
+
+    def histogram(self, kind, name, edges):
+        """Speech counts between consecutive (sorted) time edges."""
+        times = self.times(kind, name)
+        positions = [bisect_left(times, edge) for edge in edges]
+        return [hi - lo for lo, hi in zip(positions, positions[1:])]
+
+    def rate(self, kind, name, minutes, bucket_minutes, now=None):
+        """Speeches per minute in consecutive buckets covering the last `minutes`.
+
+        Returns (bucket_end_offsets, rates), offsets in minutes relative to
+        now (0 is the current bucket end).
+        """
+        now = monotonic() if now is None else now
+        buckets = max(int(minutes // bucket_minutes), 1)
+        edges = [now - (buckets - i) * bucket_minutes * 60 for i in range(buckets + 1)]
+        counts = self.histogram(kind, name, edges)
+        offsets = [-(buckets - i - 1) * bucket_minutes for i in range(buckets)]
+        return offsets, [c / bucket_minutes for c in counts]
+
+
+########################
+# FUNCTIONS            #
+########################
+
+def _discard(times, t):
+    i = bisect_left(times, t)
+    if i < len(times) and times[i] == t:
+        times.pop(i)
+
+
+def wall_time(t):
+    """Convert a monotonic speech time to a POSIX timestamp."""
+    return SESSION_START_WALL + (t - SESSION_START)
+
+
+timeline = SpeechTimeline() # Global